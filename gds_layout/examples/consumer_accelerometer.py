@@ -6,6 +6,7 @@ Consumer-Grade Accelerometer Example
 
 import sys
 import os
+import io
 
 # 设置环境变量来避免NumPy 2.0兼容性问题
 os.environ['NUMPY_EXPERIMENTAL_ARRAY_FUNCTION'] = '0'
@@ -16,11 +17,31 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from theory.imu_theory import IMUTheoryCalculator, IMUPerformanceParams
 from layout.accelerometer_layout import AccelerometerLayoutGenerator
 from utils.visualization import LayoutVisualizer
+from utils.gds_writer import write_gds
+
+# 理论计算器只持有材料常数与mask参数缓存，全局共享一个实例以便共用缓存
+calculator = IMUTheoryCalculator()
 
 def create_consumer_accelerometer():
     """创建消费级加速度计示例"""
+    # 输出先写入缓冲区，结束时 (包括提前返回或出错) 一次性写出
+    out = io.StringIO()
+    try:
+        _design_consumer_accelerometer(out)
+    finally:
+        _flush_output(out)
+
+def _flush_output(out):
+    """将缓冲区中的输出写到标准输出并清空缓冲区"""
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    out.seek(0)
+    out.truncate()
+
+def _design_consumer_accelerometer(out):
+    """消费级加速度计设计流程，输出写入 out"""
     
-    print("=== 消费级加速度计设计示例 ===\n")
+    out.write("=== 消费级加速度计设计示例 ===\n\n")
     
     # 1. 定义性能参数
     performance_params = IMUPerformanceParams(
@@ -32,111 +53,83 @@ def create_consumer_accelerometer():
         power_consumption=5.0   # 功耗 5 mW
     )
     
-    print("性能参数:")
-    print(f"  灵敏度: {performance_params.sensitivity} mV/g")
-    print(f"  带宽: {performance_params.bandwidth} Hz")
-    print(f"  噪声密度: {performance_params.noise_density} μg/√Hz")
-    print(f"  量程: {performance_params.full_scale_range} g")
-    print(f"  分辨率: {performance_params.resolution} mg")
-    print(f"  功耗: {performance_params.power_consumption} mW\n")
+    out.write("性能参数:\n")
+    out.write(f"  灵敏度: {performance_params.sensitivity} mV/g\n")
+    out.write(f"  带宽: {performance_params.bandwidth} Hz\n")
+    out.write(f"  噪声密度: {performance_params.noise_density} μg/√Hz\n")
+    out.write(f"  量程: {performance_params.full_scale_range} g\n")
+    out.write(f"  分辨率: {performance_params.resolution} mg\n")
+    out.write(f"  功耗: {performance_params.power_consumption} mW\n\n")
     
     # 2. 理论计算
-    print("正在进行理论计算...")
-    calculator = IMUTheoryCalculator()
+    out.write("正在进行理论计算...\n")
     mask_params = calculator.calculate_mask_parameters(performance_params)
     
-    print("计算得到的Mask参数:")
+    out.write("计算得到的Mask参数:\n")
     for key, value in mask_params.items():
-        print(f"  {key}: {value:.2f} μm")
+        out.write(f"  {key}: {value:.2f} μm\n")
     
     # 3. 设计验证
-    print("\n正在进行设计验证...")
+    out.write("\n正在进行设计验证...\n")
     is_valid, message = calculator.validate_design(mask_params)
     
     if is_valid:
-        print(f"✓ {message}")
+        out.write(f"✓ {message}\n")
     else:
-        print(f"✗ {message}")
+        out.write(f"✗ {message}\n")
         return
     
     # 4. 生成版图
-    print("\n正在生成版图...")
+    out.write("\n正在生成版图...\n")
     layout_generator = AccelerometerLayoutGenerator()
     component = layout_generator.generate_accelerometer_layout(mask_params)
     
     # 5. 显示版图预览
-    print("\n正在生成版图预览...")
+    out.write("\n正在生成版图预览...\n")
     visualizer = LayoutVisualizer()
     
     # 保存预览图片
     preview_filename = "layout_preview.png"
     visualizer.save_layout_preview(component, preview_filename, 
                                  "消费级加速度计版图预览")
-    print(f"✓ 版图预览已保存: {preview_filename}")
+    out.write(f"✓ 版图预览已保存: {preview_filename}\n")
     
     # 显示预览图片
-    print("正在显示版图预览...")
+    out.write("正在显示版图预览...\n")
+    # 显示窗口会阻塞直到关闭，先输出已有的进度信息
+    _flush_output(out)
     try:
         visualizer.show_layout_preview(component, "消费级加速度计版图预览")
-        print("✓ 版图预览已显示")
+        out.write("✓ 版图预览已显示\n")
     except Exception as e:
-        print(f"⚠ 无法显示预览图片: {e}")
-        print("请查看保存的预览图片文件")
+        out.write(f"⚠ 无法显示预览图片: {e}\n")
+        out.write("请查看保存的预览图片文件\n")
     
     # 6. 保存GDS文件
     output_file = "consumer_accelerometer.gds"
-    component.write_gds(output_file)
-    print(f"✓ GDS文件已保存: {output_file}")
+    write_gds(component, output_file)
+    out.write(f"✓ GDS文件已保存: {output_file}\n")
     
     # 7. 计算设计指标
-    print("\n=== 设计指标 ===")
-    
-    # 质量块面积 (μm²)
-    proof_mass_area = mask_params["proof_mass_size"] ** 2
-    print(f"质量块面积: {proof_mass_area:.0f} μm²")
+    out.write("\n=== 设计指标 ===\n")
     
-    # 弹簧刚度 (N/m) - 确保单位转换正确
-    silicon_youngs_modulus_Pa = calculator.silicon.youngs_modulus * 1e9 # GPa to Pa
-    silicon_thickness_m = calculator.silicon.thickness * 1e-6 # μm to m
-    spring_width_m = mask_params["spring_width"] * 1e-6 # μm to m
-    spring_length_m = mask_params["spring_length"] * 1e-6 # μm to m
-    
-    I_m4 = spring_width_m * silicon_thickness_m**3 / 12 # 惯性矩 (m^4)
-    spring_stiffness = 4 * silicon_youngs_modulus_Pa * I_m4 / spring_length_m**3 # 总刚度 (N/m)
-    print(f"弹簧刚度: {spring_stiffness:.2e} N/m")
-    
-    # 自然频率 (Hz)
-    natural_freq = calculator.calculate_natural_frequency(
-        mask_params["proof_mass_size"],
-        mask_params["spring_length"],
-        mask_params["spring_width"],
-        calculator.silicon.thickness # 传递微米单位的厚度
-    )
-    print(f"自然频率: {natural_freq:.1f} Hz")
-    
-    # 吸合电压 (V)
-    pull_in_voltage = calculator.calculate_pull_in_voltage(
+    indicators = calculator.calculate_design_indicators(
         mask_params["proof_mass_size"],
         mask_params["spring_length"],
         mask_params["spring_width"],
         mask_params["gap"]
     )
-    print(f"吸合电压: {pull_in_voltage:.2f} V")
-    
-    # 阻尼比 - 传递实际计算的弹簧长度和宽度
-    damping_ratio = calculator.calculate_damping_ratio(
-        mask_params["proof_mass_size"],
-        mask_params["spring_length"],
-        mask_params["spring_width"],
-        mask_params["gap"]
-    )
-    print(f"阻尼比: {damping_ratio:.3f}")
-    
-    print("\n=== 设计完成 ===")
-    print("消费级加速度计设计已完成！")
-    print("生成的GDS文件可用于流片制造。")
-    print(f"版图预览图片: {preview_filename}")
-    print(f"GDS文件: {output_file}")
+    out.write(f"质量块面积: {indicators['proof_mass_area']:.0f} μm²\n")
+    out.write(f"弹簧刚度: {indicators['spring_stiffness']:.2e} N/m\n")
+    out.write(f"自然频率: {indicators['natural_freq']:.1f} Hz\n")
+    out.write(f"吸合电压: {indicators['pull_in_voltage']:.2f} V\n")
+    out.write(f"阻尼比: {indicators['damping_ratio']:.3f}\n")
+    
+    out.write("\n=== 设计完成 ===\n")
+    out.write("消费级加速度计设计已完成！\n")
+    out.write("生成的GDS文件可用于流片制造。\n")
+    out.write(f"版图预览图片: {preview_filename}\n")
+    out.write(f"GDS文件: {output_file}\n")
 
 def main():
     """主函数"""
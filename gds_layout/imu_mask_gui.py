@@ -1,14 +1,20 @@
 import sys
-import gdsfactory as gf
+import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox
 )
 from PyQt5.QtCore import Qt
 
 # 1. 定义20种自定义layer
-LAYERS = {
-    f"layer{i+1}": (i+1, 0) for i in range(20)
-}
+class _Layers(tuple):
+    """按整数下标访问的 (layer, datatype) 元组，兼容旧的 "layerN" 字符串键"""
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = int(key[len("layer"):]) - 1
+        return tuple.__getitem__(self, key)
+
+LAYERS = _Layers((i, 0) for i in range(1, 21))
 
 # 2. 理论计算mask参数（示例，实际请根据IMU理论公式调整）
 def calculate_mask_params(sensitivity, bandwidth, noise, full_scale):
@@ -23,28 +29,47 @@ def calculate_mask_params(sensitivity, bandwidth, noise, full_scale):
     }
 
 # 3. 版图生成函数
+# gdsfactory 导入耗时较长，推迟到第一次生成版图时再导入，使GUI尽快显示
+_gf = None
+
+def _get_gf():
+    global _gf
+    if _gf is None:
+        import gdsfactory
+        _gf = gdsfactory
+    return _gf
+
+# 单位正方形顶点，外框由其缩放平移得到
+_UNIT_SQUARE = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+
 def create_imu_layout(mask_params, layers):
+    gf = _get_gf()
     c = gf.Component("IMU")
     # Proof mass
     c.add_ref(gf.components.rectangle(size=(mask_params["proof_mass_size"], mask_params["proof_mass_size"]),
-                                      layer=layers["layer1"]))
+                                      layer=layers[0]))
     # Four anchors
-    anchor = gf.components.rectangle(size=(mask_params["anchor_size"], mask_params["anchor_size"]), layer=layers["layer2"])
-    c.add_ref(anchor).move((0, 0))
-    c.add_ref(anchor).move((mask_params["proof_mass_size"]-mask_params["anchor_size"], 0))
-    c.add_ref(anchor).move((0, mask_params["proof_mass_size"]-mask_params["anchor_size"]))
-    c.add_ref(anchor).move((mask_params["proof_mass_size"]-mask_params["anchor_size"],
-                            mask_params["proof_mass_size"]-mask_params["anchor_size"]))
+    anchor = gf.components.rectangle(size=(mask_params["anchor_size"], mask_params["anchor_size"]), layer=layers[1])
+    anchor_pitch = mask_params["proof_mass_size"] - mask_params["anchor_size"]
+    if anchor_pitch > 0:
+        # 四角锚点作为一个 2x2 阵列引用 (AREF) 放置
+        c.add_array(anchor, columns=2, rows=2, spacing=(anchor_pitch, anchor_pitch))
+    else:
+        # 锚点不小于质量块时阵列间距非正，退回逐个放置
+        for x, y in ((0, 0), (anchor_pitch, 0), (0, anchor_pitch), (anchor_pitch, anchor_pitch)):
+            c.add_ref(anchor).move((x, y))
     # 四根弹簧
-    spring = gf.components.rectangle(size=(mask_params["spring_width"], mask_params["proof_mass_size"]), layer=layers["layer3"])
+    spring = gf.components.rectangle(size=(mask_params["spring_width"], mask_params["proof_mass_size"]), layer=layers[2])
     c.add_ref(spring).move((-mask_params["spring_width"], 0))
     c.add_ref(spring).move((mask_params["proof_mass_size"], 0))
-    # 其它layer示例
-    for i in range(4, 21):
-        # 在版图外围画一圈不同layer的框，示意layer可自定义
-        offset = i * 2
-        size = mask_params["proof_mass_size"] + offset * 2
-        c.add_ref(gf.components.rectangle(size=(size, size), layer=layers[f"layer{i}"])).move((-offset, -offset))
+    # 其它layer示例: 在版图外围画一圈不同layer的框，示意layer可自定义
+    # 由单位正方形一次性缩放平移出全部17个外框的顶点 (17, 4, 2)，直接按层添加多边形
+    ring_layers = np.arange(4, 21)
+    offsets = ring_layers * 2.0
+    sizes = mask_params["proof_mass_size"] + offsets * 2
+    frames = _UNIT_SQUARE * sizes[:, None, None] - offsets[:, None, None]
+    for layer, points in zip(layers[3:20], frames):
+        c.add_polygon(points, layer=layer)
     return c
 
 # 4. GUI界面
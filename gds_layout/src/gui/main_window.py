@@ -5,6 +5,9 @@ Main GUI Window for MEMS IMU Design
 
 import sys
 import os
+import dataclasses
+import functools
+import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QLineEdit, QPushButton, QFileDialog, QMessageBox,
@@ -18,13 +21,62 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from theory.imu_theory import IMUTheoryCalculator, IMUPerformanceParams
-from layout.accelerometer_layout import AccelerometerLayoutGenerator
+from utils.gds_writer import write_gds
 
-class DesignWorker(QThread):
-    """后台设计工作线程"""
+# 理论计算器只持有材料常数与mask参数缓存，全局共享一个实例以便共用缓存
+_CALC = IMUTheoryCalculator()
+
+# 预设参数: 每行依次为 灵敏度、带宽、噪声密度、量程、分辨率、功耗
+_PRESET_NAMES = (
+    "消费级加速度计",
+    "工业级加速度计",
+    "汽车级加速度计",
+    "高精度加速度计",
+)
+_PRESET_ARR = np.array([
+    [100.0, 1000.0, 50.0, 10.0, 1.0, 5.0],
+    [200.0, 500.0, 20.0, 20.0, 0.5, 10.0],
+    [150.0, 2000.0, 30.0, 50.0, 2.0, 15.0],
+    [500.0, 100.0, 5.0, 5.0, 0.1, 20.0],
+], dtype=np.float64)
+# 预设名称 -> 参数元组 (Python float)，切换预设时直接查表
+_PRESET_IDX = {name: tuple(row) for name, row in zip(_PRESET_NAMES, _PRESET_ARR.tolist())}
+
+def _mask_params(*performance_fields):
+    """按性能参数取mask参数 (由 _CALC 内部缓存，返回副本)"""
+    return _CALC.calculate_mask_parameters(IMUPerformanceParams(*performance_fields))
+
+@functools.lru_cache(maxsize=64)
+def _cached_validation(*performance_fields):
+    """按性能参数缓存设计验证结果 (bool, str)"""
+    return _CALC.validate_design(_mask_params(*performance_fields))
+
+@functools.lru_cache(maxsize=64)
+def _cached_indicators(*performance_fields):
+    """按性能参数缓存设计指标 (面积、刚度、频率等)"""
+    mask_params = _mask_params(*performance_fields)
+    return _CALC.calculate_design_indicators(
+        mask_params["proof_mass_size"],
+        mask_params["spring_length"],
+        mask_params["spring_width"],
+        mask_params["gap"]
+    )
+
+class LayoutPrewarmWorker(QThread):
+    """后台预先导入版图模块 (gdsfactory)，避免首次设计时等待导入"""
+    
+    def run(self):
+        try:
+            import layout.accelerometer_layout  # noqa: F401
+        except Exception:
+            # 导入失败时由 LayoutWorker 在实际生成版图时报告错误
+            pass
+
+class TheoryWorker(QThread):
+    """后台理论计算线程 (计算mask参数、验证设计、计算设计指标)"""
     progress_updated = pyqtSignal(int)
     status_updated = pyqtSignal(str)
-    design_completed = pyqtSignal(dict)
+    params_ready = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
     
     def __init__(self, performance_params):
@@ -37,52 +89,149 @@ class DesignWorker(QThread):
             self.progress_updated.emit(20)
             
             # 理论计算
-            calculator = IMUTheoryCalculator()
-            mask_params = calculator.calculate_mask_parameters(self.performance_params)
+            performance_fields = dataclasses.astuple(self.performance_params)
+            mask_params = _mask_params(*performance_fields)
             
             self.status_updated.emit("正在验证设计...")
             self.progress_updated.emit(40)
             
             # 设计验证
-            is_valid, message = calculator.validate_design(mask_params)
+            is_valid, message = _cached_validation(*performance_fields)
             if not is_valid:
                 self.error_occurred.emit(f"设计验证失败: {message}")
                 return
             
-            self.status_updated.emit("正在生成版图...")
-            self.progress_updated.emit(60)
-            
-            # 生成版图
-            layout_generator = AccelerometerLayoutGenerator()
-            component = layout_generator.generate_accelerometer_layout(mask_params)
+            # 设计指标 (随mask参数一并缓存)
+            design_indicators = dict(_cached_indicators(*performance_fields))
             
             self.status_updated.emit("设计完成")
             self.progress_updated.emit(100)
             
-            self.design_completed.emit({
+            self.params_ready.emit({
                 'mask_params': mask_params,
-                'component': component,
+                'design_indicators': design_indicators,
                 'performance_params': self.performance_params
             })
             
         except Exception as e:
             self.error_occurred.emit(f"设计过程中发生错误: {str(e)}")
 
+class LayoutWorker(QThread):
+    """后台版图生成线程 (仅在导出GDS时按需运行)"""
+    component_ready = pyqtSignal(object)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, mask_params, parent=None):
+        super().__init__(parent)
+        self.mask_params = mask_params
+        
+    def run(self):
+        try:
+            # gdsfactory 导入耗时较长，推迟到真正需要时
+            from layout.accelerometer_layout import AccelerometerLayoutGenerator
+            layout_generator = AccelerometerLayoutGenerator()
+            component = layout_generator.generate_accelerometer_layout(self.mask_params)
+            self.component_ready.emit(component)
+        except Exception as e:
+            self.error_occurred.emit(f"生成版图时发生错误: {str(e)}")
+
+class GdsExportWorker(QThread):
+    """后台GDS导出线程"""
+    export_completed = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, component, file_path):
+        super().__init__()
+        self.component = component
+        self.file_path = file_path
+        
+    def run(self):
+        try:
+            write_gds(self.component, self.file_path)
+            self.export_completed.emit(self.file_path)
+        except Exception as e:
+            self.error_occurred.emit(f"保存GDS文件时发生错误: {str(e)}")
+
 class MainWindow(QMainWindow):
     """主窗口"""
     
+    # 共享字体 (需在 QApplication 创建后构造，首次实例化窗口时初始化)
+    TITLE_FONT = None
+    BUTTON_FONT = None
+    
+    # 性能参数输入框: (标签, 属性名, 最小值, 最大值, 默认值, 单位后缀)，顺序与 IMUPerformanceParams 字段一致
+    _PARAM_SPEC = (
+        ("灵敏度 (mV/g):", "sensitivity_input", 0.1, 1000.0, 100.0, " mV/g"),
+        ("带宽 (Hz):", "bandwidth_input", 1.0, 10000.0, 1000.0, " Hz"),
+        ("噪声密度 (μg/√Hz):", "noise_input", 0.1, 1000.0, 50.0, " μg/√Hz"),
+        ("量程 (g):", "full_scale_input", 1.0, 100.0, 10.0, " g"),
+        ("分辨率 (mg):", "resolution_input", 0.1, 100.0, 1.0, " mg"),
+        ("功耗 (mW):", "power_input", 0.1, 100.0, 5.0, " mW"),
+    )
+    
+    # 结果显示模板
+    _PARAMS_TEMPLATE = (
+        "=== 计算得到的Mask参数 ===\n\n"
+        "{mask}"
+        "\n=== 性能参数 ===\n\n"
+        "灵敏度: {s:.2f} mV/g\n"
+        "带宽: {bw:.2f} Hz\n"
+        "噪声密度: {noise:.2f} μg/√Hz\n"
+        "量程: {fs:.2f} g\n"
+        "分辨率: {res:.2f} mg\n"
+        "功耗: {pwr:.2f} mW\n"
+    )
+    
+    _INFO_TEMPLATE = (
+        "=== 设计信息 ===\n\n"
+        "质量块面积: {area:.0f} μm²\n"
+        "弹簧刚度: {k:.2e} N/m\n"
+        "设计类型: 电容式加速度计\n"
+        "制造工艺: 表面微加工\n"
+        "材料: 单晶硅\n"
+        "层数: 20层\n"
+        "\n=== 制造约束 ===\n\n"
+        "✓ 最小线宽: 2 μm\n"
+        "✓ 最小间距: 3 μm\n"
+        "✓ 吸合电压检查通过\n"
+    )
+    
+    _EXPORT_TEMPLATE = (
+        "=== IMU设计参数 ===\n\n"
+        "性能参数:\n"
+        "  灵敏度: {s:.2f} mV/g\n"
+        "  带宽: {bw:.2f} Hz\n"
+        "  噪声密度: {noise:.2f} μg/√Hz\n"
+        "  量程: {fs:.2f} g\n"
+        "  分辨率: {res:.2f} mg\n"
+        "  功耗: {pwr:.2f} mW\n\n"
+        "Mask参数:\n"
+        "{mask}"
+    )
+    
     def __init__(self):
         super().__init__()
+        if MainWindow.TITLE_FONT is None:
+            MainWindow.TITLE_FONT = QFont("Arial", 16, QFont.Bold)
+            MainWindow.BUTTON_FONT = QFont("Arial", 12, QFont.Bold)
+        
         self.setWindowTitle("MEMS IMU Mask Layout 设计工具")
         self.setGeometry(100, 100, 1200, 800)
         
         # 初始化组件
         self.performance_params = None
         self.mask_params = None
+        self.design_indicators = None
         self.component = None
+        self.layout_worker = None
+        self.pending_gds_path = None
         
         self.init_ui()
         
+        # 界面显示后在低优先级线程中预热版图模块
+        self.prewarm_worker = LayoutPrewarmWorker()
+        self.prewarm_worker.start(QThread.LowPriority)
+        
     def init_ui(self):
         """初始化用户界面"""
         central_widget = QWidget()
@@ -108,7 +257,7 @@ class MainWindow(QMainWindow):
         
         # 标题
         title = QLabel("IMU性能参数输入")
-        title.setFont(QFont("Arial", 16, QFont.Bold))
+        title.setFont(MainWindow.TITLE_FONT)
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -116,53 +265,22 @@ class MainWindow(QMainWindow):
         param_group = QGroupBox("性能参数")
         param_layout = QGridLayout()
         
-        # 灵敏度
-        param_layout.addWidget(QLabel("灵敏度 (mV/g):"), 0, 0)
-        self.sensitivity_input = QDoubleSpinBox()
-        self.sensitivity_input.setRange(0.1, 1000.0)
-        self.sensitivity_input.setValue(100.0)
-        self.sensitivity_input.setSuffix(" mV/g")
-        param_layout.addWidget(self.sensitivity_input, 0, 1)
-        
-        # 带宽
-        param_layout.addWidget(QLabel("带宽 (Hz):"), 1, 0)
-        self.bandwidth_input = QDoubleSpinBox()
-        self.bandwidth_input.setRange(1.0, 10000.0)
-        self.bandwidth_input.setValue(1000.0)
-        self.bandwidth_input.setSuffix(" Hz")
-        param_layout.addWidget(self.bandwidth_input, 1, 1)
-        
-        # 噪声密度
-        param_layout.addWidget(QLabel("噪声密度 (μg/√Hz):"), 2, 0)
-        self.noise_input = QDoubleSpinBox()
-        self.noise_input.setRange(0.1, 1000.0)
-        self.noise_input.setValue(50.0)
-        self.noise_input.setSuffix(" μg/√Hz")
-        param_layout.addWidget(self.noise_input, 2, 1)
-        
-        # 量程
-        param_layout.addWidget(QLabel("量程 (g):"), 3, 0)
-        self.full_scale_input = QDoubleSpinBox()
-        self.full_scale_input.setRange(1.0, 100.0)
-        self.full_scale_input.setValue(10.0)
-        self.full_scale_input.setSuffix(" g")
-        param_layout.addWidget(self.full_scale_input, 3, 1)
-        
-        # 分辨率
-        param_layout.addWidget(QLabel("分辨率 (mg):"), 4, 0)
-        self.resolution_input = QDoubleSpinBox()
-        self.resolution_input.setRange(0.1, 100.0)
-        self.resolution_input.setValue(1.0)
-        self.resolution_input.setSuffix(" mg")
-        param_layout.addWidget(self.resolution_input, 4, 1)
-        
-        # 功耗
-        param_layout.addWidget(QLabel("功耗 (mW):"), 5, 0)
-        self.power_input = QDoubleSpinBox()
-        self.power_input.setRange(0.1, 100.0)
-        self.power_input.setValue(5.0)
-        self.power_input.setSuffix(" mW")
-        param_layout.addWidget(self.power_input, 5, 1)
+        self._spinboxes = []
+        for row, (label, attr, minimum, maximum, default, suffix) in enumerate(self._PARAM_SPEC):
+            spinbox = QDoubleSpinBox()
+            spinbox.setRange(minimum, maximum)
+            spinbox.setValue(default)
+            spinbox.setSuffix(suffix)
+            param_layout.addWidget(QLabel(label), row, 0)
+            param_layout.addWidget(spinbox, row, 1)
+            setattr(self, attr, spinbox)
+            self._spinboxes.append(spinbox)
+        self._spinboxes = tuple(self._spinboxes)
+        
+        # 各参数当前值缓存 (与 IMUPerformanceParams 字段顺序一致)，随 valueChanged 更新
+        self._param_vec = np.array([sb.value() for sb in self._spinboxes], dtype=np.float64)
+        for i, sb in enumerate(self._spinboxes):
+            sb.valueChanged.connect(functools.partial(self._on_param_changed, i))
         
         param_group.setLayout(param_layout)
         layout.addWidget(param_group)
@@ -172,12 +290,7 @@ class MainWindow(QMainWindow):
         preset_layout = QVBoxLayout()
         
         self.preset_combo = QComboBox()
-        self.preset_combo.addItems([
-            "消费级加速度计",
-            "工业级加速度计", 
-            "汽车级加速度计",
-            "高精度加速度计"
-        ])
+        self.preset_combo.addItems(list(_PRESET_NAMES))
         self.preset_combo.currentTextChanged.connect(self.load_preset)
         preset_layout.addWidget(self.preset_combo)
         
@@ -186,7 +299,7 @@ class MainWindow(QMainWindow):
         
         # 设计按钮
         self.design_button = QPushButton("开始设计")
-        self.design_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.design_button.setFont(MainWindow.BUTTON_FONT)
         self.design_button.clicked.connect(self.start_design)
         layout.addWidget(self.design_button)
         
@@ -211,7 +324,7 @@ class MainWindow(QMainWindow):
         
         # 标题
         title = QLabel("设计结果")
-        title.setFont(QFont("Arial", 16, QFont.Bold))
+        title.setFont(MainWindow.TITLE_FONT)
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -258,60 +371,20 @@ class MainWindow(QMainWindow):
         
     def load_preset(self, preset_name):
         """加载预设参数"""
-        presets = {
-            "消费级加速度计": {
-                "sensitivity": 100.0,
-                "bandwidth": 1000.0,
-                "noise_density": 50.0,
-                "full_scale_range": 10.0,
-                "resolution": 1.0,
-                "power_consumption": 5.0
-            },
-            "工业级加速度计": {
-                "sensitivity": 200.0,
-                "bandwidth": 500.0,
-                "noise_density": 20.0,
-                "full_scale_range": 20.0,
-                "resolution": 0.5,
-                "power_consumption": 10.0
-            },
-            "汽车级加速度计": {
-                "sensitivity": 150.0,
-                "bandwidth": 2000.0,
-                "noise_density": 30.0,
-                "full_scale_range": 50.0,
-                "resolution": 2.0,
-                "power_consumption": 15.0
-            },
-            "高精度加速度计": {
-                "sensitivity": 500.0,
-                "bandwidth": 100.0,
-                "noise_density": 5.0,
-                "full_scale_range": 5.0,
-                "resolution": 0.1,
-                "power_consumption": 20.0
-            }
-        }
-        
-        if preset_name in presets:
-            preset = presets[preset_name]
-            self.sensitivity_input.setValue(preset["sensitivity"])
-            self.bandwidth_input.setValue(preset["bandwidth"])
-            self.noise_input.setValue(preset["noise_density"])
-            self.full_scale_input.setValue(preset["full_scale_range"])
-            self.resolution_input.setValue(preset["resolution"])
-            self.power_input.setValue(preset["power_consumption"])
+        values = _PRESET_IDX.get(preset_name)
+        if values is None:
+            return
+        
+        for spinbox, value in zip(self._spinboxes, values):
+            spinbox.setValue(value)
             
+    def _on_param_changed(self, index, value):
+        """参数输入变化时更新缓存"""
+        self._param_vec[index] = value
+        
     def get_performance_params(self):
         """获取性能参数"""
-        return IMUPerformanceParams(
-            sensitivity=self.sensitivity_input.value(),
-            bandwidth=self.bandwidth_input.value(),
-            noise_density=self.noise_input.value(),
-            full_scale_range=self.full_scale_input.value(),
-            resolution=self.resolution_input.value(),
-            power_consumption=self.power_input.value()
-        )
+        return IMUPerformanceParams(*self._param_vec.tolist())
         
     def start_design(self):
         """开始设计"""
@@ -324,11 +397,11 @@ class MainWindow(QMainWindow):
             self.progress_bar.setVisible(True)
             self.progress_bar.setValue(0)
             
-            # 启动工作线程
-            self.worker = DesignWorker(self.performance_params)
+            # 启动理论计算线程 (版图在导出GDS时才生成)
+            self.worker = TheoryWorker(self.performance_params)
             self.worker.progress_updated.connect(self.progress_bar.setValue)
             self.worker.status_updated.connect(self.status_label.setText)
-            self.worker.design_completed.connect(self.design_completed)
+            self.worker.params_ready.connect(self.design_completed)
             self.worker.error_occurred.connect(self.design_error)
             self.worker.start()
             
@@ -339,7 +412,12 @@ class MainWindow(QMainWindow):
     def design_completed(self, result):
         """设计完成"""
         self.mask_params = result['mask_params']
-        self.component = result['component']
+        self.design_indicators = result['design_indicators']
+        
+        # 参数已变化，丢弃旧版图及正在进行的版图生成
+        self.component = None
+        self.layout_worker = None
+        self.pending_gds_path = None
         
         # 更新显示
         self.update_params_display()
@@ -366,61 +444,104 @@ class MainWindow(QMainWindow):
         if not self.mask_params:
             return
             
-        text = "=== 计算得到的Mask参数 ===\n\n"
-        
-        for key, value in self.mask_params.items():
-            text += f"{key}: {value:.2f} μm\n"
-            
-        text += "\n=== 性能参数 ===\n\n"
-        text += f"灵敏度: {self.performance_params.sensitivity:.2f} mV/g\n"
-        text += f"带宽: {self.performance_params.bandwidth:.2f} Hz\n"
-        text += f"噪声密度: {self.performance_params.noise_density:.2f} μg/√Hz\n"
-        text += f"量程: {self.performance_params.full_scale_range:.2f} g\n"
-        text += f"分辨率: {self.performance_params.resolution:.2f} mg\n"
-        text += f"功耗: {self.performance_params.power_consumption:.2f} mW\n"
+        mask = "".join(f"{key}: {value:.2f} μm\n" for key, value in self.mask_params.items())
+        text = self._PARAMS_TEMPLATE.format_map(self._performance_format_args(mask=mask))
         
-        self.params_text.setText(text)
+        self._set_plain_text(self.params_text, text)
         
     def update_info_display(self):
         """更新设计信息显示"""
         if not self.mask_params:
             return
             
-        text = "=== 设计信息 ===\n\n"
-        
-        # 计算一些设计指标
-        proof_mass_area = self.mask_params["proof_mass_size"] ** 2
-        spring_stiffness = 4 * 169e9 * (self.mask_params["spring_width"] * 50**3 / 12) / self.mask_params["spring_length"]**3
-        
-        text += f"质量块面积: {proof_mass_area:.0f} μm²\n"
-        text += f"弹簧刚度: {spring_stiffness:.2e} N/m\n"
-        text += f"设计类型: 电容式加速度计\n"
-        text += f"制造工艺: 表面微加工\n"
-        text += f"材料: 单晶硅\n"
-        text += f"层数: 20层\n"
-        
-        text += "\n=== 制造约束 ===\n\n"
-        text += "✓ 最小线宽: 2 μm\n"
-        text += "✓ 最小间距: 3 μm\n"
-        text += "✓ 吸合电压检查通过\n"
+        # 设计指标已在设计线程中计算
+        indicators = self.design_indicators
+        text = self._INFO_TEMPLATE.format(area=indicators["proof_mass_area"], k=indicators["spring_stiffness"])
+        
+        self._set_plain_text(self.info_text, text)
+        
+    def _performance_format_args(self, **extra):
+        """结果模板中性能参数字段的取值"""
+        p = self.performance_params
+        return dict(
+            s=p.sensitivity, bw=p.bandwidth, noise=p.noise_density,
+            fs=p.full_scale_range, res=p.resolution, pwr=p.power_consumption,
+            **extra
+        )
         
-        self.info_text.setText(text)
+    @staticmethod
+    def _set_plain_text(text_edit, text):
+        """以纯文本方式整体写入 (跳过 setText 的富文本检测)"""
+        text_edit.setUpdatesEnabled(False)
+        text_edit.document().setPlainText(text)
+        text_edit.setUpdatesEnabled(True)
         
     def export_gds(self):
         """导出GDS文件"""
-        if not self.component:
+        if not self.mask_params:
             return
+        
+        # 版图按需生成，与文件对话框并行进行
+        if self.component is None and self.layout_worker is None:
+            # 以窗口为父对象，参数变化后丢弃引用时线程仍可安全运行结束
+            self.layout_worker = LayoutWorker(self.mask_params, self)
+            self.layout_worker.finished.connect(self.layout_worker.deleteLater)
+            self.layout_worker.component_ready.connect(self.layout_completed)
+            self.layout_worker.error_occurred.connect(self.layout_error)
+            self.layout_worker.start()
             
         file_path, _ = QFileDialog.getSaveFileName(
             self, "保存GDS文件", "imu_accelerometer.gds", "GDSII Files (*.gds)"
         )
         
         if file_path:
-            try:
-                self.component.write_gds(file_path)
-                QMessageBox.information(self, "成功", f"GDS文件已保存到:\n{file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"保存GDS文件时发生错误: {str(e)}")
+            self.export_gds_button.setEnabled(False)
+            if self.component is None:
+                # 版图生成完成后再写文件
+                self.pending_gds_path = file_path
+                self.status_label.setText("正在生成版图...")
+            else:
+                self.write_gds_file(file_path)
+                
+    def layout_completed(self, component):
+        """版图生成完成"""
+        if self.sender() is not self.layout_worker:
+            return  # 设计参数已变化，丢弃过期版图
+        self.component = component
+        self.layout_worker = None
+        self.status_label.setText("版图生成完成")
+        
+        if self.pending_gds_path:
+            file_path, self.pending_gds_path = self.pending_gds_path, None
+            self.write_gds_file(file_path)
+            
+    def layout_error(self, error_message):
+        """版图生成错误"""
+        if self.sender() is not self.layout_worker:
+            return
+        self.layout_worker = None
+        self.pending_gds_path = None
+        self.export_gds_button.setEnabled(True)
+        self.status_label.setText("就绪")
+        QMessageBox.critical(self, "错误", error_message)
+        
+    def write_gds_file(self, file_path):
+        """在后台线程写GDS文件，避免阻塞界面"""
+        self.export_gds_button.setEnabled(False)
+        self.export_worker = GdsExportWorker(self.component, file_path)
+        self.export_worker.export_completed.connect(self.gds_exported)
+        self.export_worker.error_occurred.connect(self.gds_export_error)
+        self.export_worker.start()
+            
+    def gds_exported(self, file_path):
+        """GDS导出完成"""
+        self.export_gds_button.setEnabled(True)
+        QMessageBox.information(self, "成功", f"GDS文件已保存到:\n{file_path}")
+        
+    def gds_export_error(self, error_message):
+        """GDS导出错误"""
+        self.export_gds_button.setEnabled(True)
+        QMessageBox.critical(self, "错误", error_message)
                 
     def export_params(self):
         """导出参数文件"""
@@ -433,20 +554,11 @@ class MainWindow(QMainWindow):
         
         if file_path:
             try:
+                mask = "".join(f"  {key}: {value:.2f} μm\n" for key, value in self.mask_params.items())
+                text = self._EXPORT_TEMPLATE.format_map(self._performance_format_args(mask=mask))
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("=== IMU设计参数 ===\n\n")
-                    f.write("性能参数:\n")
-                    f.write(f"  灵敏度: {self.performance_params.sensitivity:.2f} mV/g\n")
-                    f.write(f"  带宽: {self.performance_params.bandwidth:.2f} Hz\n")
-                    f.write(f"  噪声密度: {self.performance_params.noise_density:.2f} μg/√Hz\n")
-                    f.write(f"  量程: {self.performance_params.full_scale_range:.2f} g\n")
-                    f.write(f"  分辨率: {self.performance_params.resolution:.2f} mg\n")
-                    f.write(f"  功耗: {self.performance_params.power_consumption:.2f} mW\n\n")
+                    f.write(text)
                     
-                    f.write("Mask参数:\n")
-                    for key, value in self.mask_params.items():
-                        f.write(f"  {key}: {value:.2f} μm\n")
-                        
                 QMessageBox.information(self, "成功", f"参数文件已保存到:\n{file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"保存参数文件时发生错误: {str(e)}") 
\ No newline at end of file
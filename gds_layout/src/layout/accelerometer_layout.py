@@ -3,444 +3,446 @@ Consumer-Grade Accelerometer Layout Generator
 消费级加速度计版图生成器
 """
 
+import functools
 import gdsfactory as gf
-from typing import Dict, Tuple, List
+from dataclasses import dataclass, fields
+from typing import Dict, Tuple, List, Union, NamedTuple, Optional
 import numpy as np
 from .layer_definitions import MEMSLayerDefinitions
 
+# 版图数据库单位 (μm)，即 1 nm 网格
+DBU = 1e-3
+
+# 器件中与设计参数无关的固定尺寸 (μm)
+BOND_PAD_SIZE = 200.0     # 键合焊盘边长
+ROUTING_WIDTH = 20.0      # 布线宽度
+ROUTING_LENGTH = 300.0    # 布线长度
+MARK_SIZE = 100.0         # 对准标记边长
+MARK_LINE_WIDTH = 20.0    # 对准标记线宽
+DICING_THICKNESS = 50.0   # 切割线厚度
+SEAL_RING_WIDTH = 100.0   # 密封环宽度
+GUARD_RING_WIDTH = 50.0   # 保护环宽度
+TEXT_SIZE = 50.0          # 文字大小
+HOLES_PER_ROW = 3         # 质量块每行减重孔数
+
+@dataclass(frozen=True, slots=True)
+class AccelParams:
+    """加速度计版图几何参数 (不可变，可作为缓存键)"""
+    
+    proof_mass_size: float  # 质量块边长 (μm)
+    spring_length: float    # 弹簧长度 (μm)
+    spring_width: float     # 弹簧宽度 (μm)
+    anchor_size: float      # 锚点边长 (μm)
+    electrode_size: float   # 电极边长 (μm)
+    gap: float              # 电极间隙 (μm)
+    via_size: float         # 通孔边长 (μm)
+    
+    @classmethod
+    def from_params(cls, params: Union["AccelParams", Dict[str, float]]) -> "AccelParams":
+        """由 mask 参数字典 (可含多余键) 构造，已是 AccelParams 时原样返回"""
+        if isinstance(params, cls):
+            return params
+        return cls(*(float(params[field.name]) for field in fields(cls)))
+
+class _Derived(NamedTuple):
+    """由几何参数导出的芯片级尺寸 (μm)"""
+    chip_size: float   # 芯片边长 (切割线中心)
+    ring_size: float   # 密封环外边长
+    guard_size: float  # 保护环外边长
+
+def _derived_dims(params: AccelParams) -> _Derived:
+    """计算切割线、密封环和保护环共用的芯片级尺寸"""
+    # 芯片边界 - 应该定义芯片的外部极限
+    # 考虑所有组件的最大范围来计算芯片尺寸
+    # 假设芯片中心与 proof_mass_center 对齐
+    chip_edge_distance_from_center = max(params.proof_mass_size/2 + params.spring_length + 300 + BOND_PAD_SIZE/2 + 300, 1000) # 约芯片尺寸的一半
+    chip_size = chip_edge_distance_from_center * 2
+    
+    return _Derived(
+        chip_size=chip_size,
+        ring_size=chip_size - 200,  # 密封环距离芯片边缘 100um 的裕度，两边共200um
+        guard_size=chip_size - 300  # 保护环再向内缩 50um
+    )
+
+# 版图生成接口既接受 AccelParams，也接受理论计算得到的 mask 参数字典
+ParamsLike = Union[AccelParams, Dict[str, float]]
+
+def _rectangle(width: float, height: float, layer: Tuple[int, int]) -> gf.Component:
+    """相同尺寸和层的矩形只创建一次，之后通过引用复用"""
+    # 尺寸先对齐到数据库网格再作为缓存键，避免浮点误差造成同一尺寸重复创建
+    return _rectangle_cell(round(width / DBU) * DBU, round(height / DBU) * DBU, layer)
+
+@functools.lru_cache(maxsize=None)
+def _rectangle_cell(width: float, height: float, layer: Tuple[int, int]) -> gf.Component:
+    """按 (宽, 高, 层) 缓存的矩形单元 (左下角位于原点)
+
+    缓存不设上限：单元名称由尺寸确定，若被淘汰后重建，会出现两个同名的不同单元
+    (已缓存的版图仍引用旧单元)，写入同一 GDS 时名称冲突。
+    """
+    # 直接以确定的名称 (尺寸以 nm 计) 构建，不经过 gf.components.rectangle 的参数序列化和哈希命名
+    rect = gf.Component(f"rect_{round(width / DBU)}_{round(height / DBU)}_{layer[0]}_{layer[1]}")
+    rect.add_polygon([(0, 0), (width, 0), (width, height), (0, height)], layer=layer)
+    return rect
+
+@functools.lru_cache(maxsize=256)
+def _text_cell(text: str, size: float, layer: Tuple[int, int]) -> Tuple[gf.Component, Optional[Tuple[float, float]]]:
+    """文字单元按 (内容, 字号, 层) 缓存，多个器件实例共享同一个文字单元
+
+    同时返回文字的 (宽, 高)，边界框只在创建时计算一次；空字符串等情况下为 None
+    """
+    text_comp = gf.components.text(text, size=size, layer=layer)
+    text_bbox = text_comp.bbox
+    if text_bbox is None:
+        return text_comp, None
+    return text_comp, (text_bbox[1][0] - text_bbox[0][0], text_bbox[1][1] - text_bbox[0][1])
+
+@functools.lru_cache(maxsize=None)
+def _alignment_cross(mark_size: float, line_width: float, layer: Tuple[int, int]) -> gf.Component:
+    """十字对准标记单元 (左下角位于原点)，相同尺寸和层只创建一次"""
+    cross = gf.Component(f"align_cross_{mark_size:g}_{line_width:g}_{layer[0]}_{layer[1]}")
+    lo = mark_size / 2 - line_width / 2
+    hi = mark_size / 2 + line_width / 2
+    # 水平条和垂直条 (均在 mark_size x mark_size 区域内居中)
+    cross.add_polygon([(0, lo), (mark_size, lo), (mark_size, hi), (0, hi)], layer=layer)
+    cross.add_polygon([(lo, 0), (hi, 0), (hi, mark_size), (lo, mark_size)], layer=layer)
+    return cross
+
+# 简单矩形: (左下角 x, 左下角 y, 宽, 高, 层)
+Rect = Tuple[float, float, float, float, Tuple[int, int]]
+
+def _frame_rects(center: Tuple[float, float], outer_dim: float, width: float,
+                 layer: Tuple[int, int]) -> List[Rect]:
+    """以 center 为中心、外边长 outer_dim、线宽 width 的方环，拆成互不重叠的上下左右四条矩形"""
+    x0 = center[0] - outer_dim / 2
+    y0 = center[1] - outer_dim / 2
+    inner_dim = outer_dim - 2 * width
+    return [
+        (x0, y0 + outer_dim - width, outer_dim, width, layer),  # 上
+        (x0, y0, outer_dim, width, layer),                      # 下
+        (x0, y0 + width, width, inner_dim, layer),              # 左
+        (x0 + outer_dim - width, y0 + width, width, inner_dim, layer)  # 右
+    ]
+
+# 单位正方形的四个角点，按矩形的宽高缩放即得各角点相对左下角的偏移
+_UNIT_SQUARE = np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=float)
+
+def _add_rects(c: gf.Component, rects: List[Rect]) -> List:
+    """将一批矩形按层分组，直接作为多边形写入 c，不为每个矩形创建子 Component 和引用"""
+    by_layer: Dict[Tuple[int, int], List[Tuple[float, float, float, float]]] = {}
+    for x, y, w, h, layer in rects:
+        by_layer.setdefault(layer, []).append((x, y, w, h))
+    
+    polygons = []
+    for layer, xywh in by_layer.items():
+        # 同层矩形的角点一次性算好，形状为 (N, 4, 2)
+        xywh = np.array(xywh, dtype=float)
+        # 同层矩形按 (y, x) 排序后写入：下游扫描线类算法 (KLayout DRC、布尔运算) 处理近似有序的输入更快
+        xywh = xywh[np.lexsort((xywh[:, 0], xywh[:, 1]))]
+        corners = xywh[:, None, :2] + xywh[:, None, 2:] * _UNIT_SQUARE
+        # 一次性对齐到数据库网格 (整数 DBU)，不同部件的共边精确重合，写入时无需逐个多边形吸附
+        corners = np.rint(corners / DBU).astype(np.int64) * DBU
+        polygons.extend(c.add_polygon(points, layer=layer) for points in corners.tolist())
+    return polygons
+
 class AccelerometerLayoutGenerator:
     """加速度计版图生成器"""
     
     def __init__(self):
         self.layer_defs = MEMSLayerDefinitions()
-        
-    def create_proof_mass(self, c: gf.Component, params: Dict[str, float], 
-                          center: Tuple[float, float] = (0, 0)) -> gf.Component:
-        """创建质量块"""
-        size = params["proof_mass_size"]
-        layer_info = self.layer_defs.get_layer_info("proof_mass")
-        
-        # 主质量块
-        proof_mass = c.add_ref(
-            gf.components.rectangle(
-                size=(size, size),
-                layer=(layer_info.layer_number, layer_info.datatype)
-            )
-        ).move(center)
-        
-        # 质量块上的减重孔 (提高灵敏度)
+        # 层定义是静态的，直接引用其预先构建的 (层号, 数据类型) 表
+        self._layer_tuple = self.layer_defs.layer_tuples
+        # 相同参数的版图只生成一次 (按实例缓存，参数为不可变的 AccelParams)
+        self._build_layout = functools.lru_cache(maxsize=32)(self._build_layout)
+        
+    def _proof_mass_rects(self, params: AccelParams, 
+                          center: Tuple[float, float] = (0, 0)) -> List[Rect]:
+        """主质量块的矩形 (左下角位于 center)"""
+        size = params.proof_mass_size
+        return [(center[0], center[1], size, size, self._layer_tuple["proof_mass"])]
+    
+    def _add_proof_mass_holes(self, c: gf.Component, params: AccelParams, 
+                              center: Tuple[float, float] = (0, 0)):
+        """在质量块上放置减重孔阵列 (提高灵敏度)"""
+        size = params.proof_mass_size
         hole_size = size * 0.1
         hole_spacing = size * 0.2
-        holes_per_row = 3
-        
-        for i in range(holes_per_row):
-            for j in range(holes_per_row):
-                x = center[0] + (i - 1) * hole_spacing
-                y = center[1] + (j - 1) * hole_spacing
-                c.add_ref(
-                    gf.components.rectangle(
-                        size=(hole_size, hole_size),
-                        layer=(layer_info.layer_number, layer_info.datatype)
-                    )
-                ).move((x, y))
         
+        # 孔阵列为规则网格，作为一个阵列引用 (AREF) 放置
+        # 第 (i, j) 个孔相对中心偏移 (i - (n-1)/2, j - (n-1)/2) 个间距，n 为每行孔数
+        origin_offset = (HOLES_PER_ROW - 1) / 2 * hole_spacing
+        return c.add_array(
+            _rectangle(hole_size, hole_size, self._layer_tuple["proof_mass"]),
+            columns=HOLES_PER_ROW,
+            rows=HOLES_PER_ROW,
+            spacing=(hole_spacing, hole_spacing)
+        ).move((center[0] - origin_offset, center[1] - origin_offset))
+    
+    def create_proof_mass(self, c: gf.Component, params: ParamsLike, 
+                          center: Tuple[float, float] = (0, 0)) -> List:
+        """创建质量块"""
+        params = AccelParams.from_params(params)
+        proof_mass = _add_rects(c, self._proof_mass_rects(params, center))
+        self._add_proof_mass_holes(c, params, center)
         return proof_mass
     
-    def create_springs(self, c: gf.Component, params: Dict[str, float], 
-                       proof_mass_center: Tuple[float, float] = (0, 0)) -> List[gf.Component]:
-        """创建四根弹簧"""
-        springs = []
-        size = params["proof_mass_size"]
-        spring_length = params["spring_length"]
-        spring_width = params["spring_width"]
+    def _spring_rects(self, params: AccelParams, 
+                      proof_mass_center: Tuple[float, float] = (0, 0)) -> List[Rect]:
+        """四根弹簧的矩形"""
+        size = params.proof_mass_size
+        spring_length = params.spring_length
+        spring_width = params.spring_width
         
-        layer_info = self.layer_defs.get_layer_info("spring")
+        layer_tuple = self._layer_tuple["spring"]
         
         # 四个方向的弹簧位置 (这些坐标是弹簧矩形的左下角，相对于质量块中心)
-        spring_positions = [
-            (-spring_length, 0),  # 左
-            (size, 0),            # 右
-            (0, -spring_length),  # 下
-            (0, size)             # 上
-        ]
+        spring_positions = np.array([
+            (-spring_length, -spring_width/2),  # 左
+            (size, -spring_width/2),            # 右
+            (-spring_width/2, -spring_length),  # 下
+            (-spring_width/2, size)             # 上
+        ]) + np.asarray(proof_mass_center)
+        
+        # 每根弹簧的 (宽, 高)：前两根水平，后两根垂直
+        spring_sizes = (
+            (spring_length, spring_width),
+            (spring_length, spring_width),
+            (spring_width, spring_length),
+            (spring_width, spring_length)
+        )
+        
+        return [(x, y, w, h, layer_tuple)
+                for (x, y), (w, h) in zip(spring_positions.tolist(), spring_sizes)]
+    
+    def create_springs(self, c: gf.Component, params: ParamsLike, 
+                       proof_mass_center: Tuple[float, float] = (0, 0)) -> List:
+        """创建四根弹簧"""
+        return _add_rects(c, self._spring_rects(AccelParams.from_params(params), proof_mass_center))
+    
+    @staticmethod
+    def _anchor_positions(params: AccelParams, 
+                          proof_mass_center: Tuple[float, float] = (0, 0)) -> np.ndarray:
+        """四个锚点矩形的左下角 (4, 2)，锚点和通孔共用"""
+        size = params.proof_mass_size
+        anchor_size = params.anchor_size
+        spring_length = params.spring_length
+        
+        # 作为整个器件的角部锚点
+        return np.array([
+            (-spring_length - anchor_size, -anchor_size),  # 左下
+            (size + spring_length, -anchor_size),          # 右下
+            (-spring_length - anchor_size, size),          # 左上
+            (size + spring_length, size)                   # 右上
+        ]) + np.asarray(proof_mass_center)
+    
+    def _anchor_rects(self, params: AccelParams, 
+                      proof_mass_center: Tuple[float, float] = (0, 0),
+                      anchor_positions: Optional[np.ndarray] = None) -> List[Rect]:
+        """四个锚点的矩形"""
+        anchor_size = params.anchor_size
         
-        for i, (dx, dy) in enumerate(spring_positions):
-            if i < 2:  # 水平弹簧
-                spring = c.add_ref(
-                    gf.components.rectangle(
-                        size=(spring_length, spring_width),
-                        layer=(layer_info.layer_number, layer_info.datatype)
-                    )
-                ).move((proof_mass_center[0] + dx, proof_mass_center[1] + dy - spring_width/2))
-            else:  # 垂直弹簧
-                spring = c.add_ref(
-                    gf.components.rectangle(
-                        size=(spring_width, spring_length),
-                        layer=(layer_info.layer_number, layer_info.datatype)
-                    )
-                ).move((proof_mass_center[0] + dx - spring_width/2, proof_mass_center[1] + dy))
-            
-            springs.append(spring)
+        layer_tuple = self._layer_tuple["anchor"]
         
-        return springs
+        if anchor_positions is None:
+            anchor_positions = self._anchor_positions(params, proof_mass_center)
+        
+        return [(x, y, anchor_size, anchor_size, layer_tuple) for x, y in anchor_positions.tolist()]
     
-    def create_anchors(self, c: gf.Component, params: Dict[str, float], 
-                       proof_mass_center: Tuple[float, float] = (0, 0)) -> List[gf.Component]:
+    def create_anchors(self, c: gf.Component, params: ParamsLike, 
+                       proof_mass_center: Tuple[float, float] = (0, 0)) -> List:
         """创建四个锚点"""
-        anchors = []
-        size = params["proof_mass_size"]
-        anchor_size = params["anchor_size"]
-        spring_length = params["spring_length"]
-        
-        layer_info = self.layer_defs.get_layer_info("anchor")
-        
-        # 四个锚点位置 (这些坐标是锚点矩形的左下角，相对于质量块中心)
-        # 锚点放置在弹簧固定端的外侧
-        anchor_positions = [
-            (proof_mass_center[0] - spring_length - anchor_size, proof_mass_center[1] - anchor_size/2),  # 左下
-            (proof_mass_center[0] + size + spring_length, proof_mass_center[1] - anchor_size/2),          # 右下
-            (proof_mass_center[0] - anchor_size/2, proof_mass_center[1] - spring_length - anchor_size),  # 左上
-            (proof_mass_center[0] - anchor_size/2, proof_mass_center[1] + size + spring_length)                   # 右上
-        ]
-        # Previous comment on anchor positions seems off. Re-adjusting to be more sensible.
-        # It's better to place them directly relative to the springs they are anchoring.
-        # For the left spring at (-spring_length, 0) relative to proof_mass_center bottom-left, its anchored end is at (-spring_length, 0) + spring_width/2 on Y
-        # Let's keep the original logic for now, as it's consistent if they are corner anchors for the whole device.
-        anchor_positions = [
-            (proof_mass_center[0] - spring_length - anchor_size, proof_mass_center[1] - anchor_size),  # 左下
-            (proof_mass_center[0] + size + spring_length, proof_mass_center[1] - anchor_size),          # 右下
-            (proof_mass_center[0] - spring_length - anchor_size, proof_mass_center[1] + size),          # 左上
-            (proof_mass_center[0] + size + spring_length, proof_mass_center[1] + size)                   # 右上
-        ]
-        
-        for dx, dy in anchor_positions:
-            anchor = c.add_ref(
-                gf.components.rectangle(
-                    size=(anchor_size, anchor_size),
-                    layer=(layer_info.layer_number, layer_info.datatype)
-                )
-            ).move((dx, dy)) # 已是绝对位置
-            anchors.append(anchor)
-        
-        return anchors
+        return _add_rects(c, self._anchor_rects(AccelParams.from_params(params), proof_mass_center))
     
-    def create_electrodes(self, c: gf.Component, params: Dict[str, float], 
-                          proof_mass_center: Tuple[float, float] = (0, 0)) -> List[gf.Component]:
-        """创建检测电极"""
-        electrodes = []
-        size = params["proof_mass_size"]
-        electrode_size = params["electrode_size"]
-        gap = params["gap"]
+    def _electrode_rects(self, params: AccelParams, 
+                         proof_mass_center: Tuple[float, float] = (0, 0)) -> List[Rect]:
+        """四个检测电极的矩形"""
+        size = params.proof_mass_size
+        electrode_size = params.electrode_size
+        gap = params.gap
         
-        layer_info = self.layer_defs.get_layer_info("electrode")
+        layer_tuple = self._layer_tuple["electrode"]
         
         # 四个电极位置 (在质量块四周，这些坐标是电极矩形的左下角)
-        electrode_positions = [
-            (proof_mass_center[0] - gap - electrode_size, proof_mass_center[1] + size/2 - electrode_size/2), # 左侧，垂直居中
-            (proof_mass_center[0] + size + gap, proof_mass_center[1] + size/2 - electrode_size/2),         # 右侧，垂直居中
-            (proof_mass_center[0] + size/2 - electrode_size/2, proof_mass_center[1] - gap - electrode_size), # 下侧，水平居中
-            (proof_mass_center[0] + size/2 - electrode_size/2, proof_mass_center[1] + size + gap)           # 上侧，水平居中
-        ]
-        
-        for dx, dy in electrode_positions:
-            electrode = c.add_ref(
-                gf.components.rectangle(
-                    size=(electrode_size, electrode_size),
-                    layer=(layer_info.layer_number, layer_info.datatype)
-                )
-            ).move((dx, dy))
-            electrodes.append(electrode)
-        
-        return electrodes
+        electrode_positions = np.array([
+            (-gap - electrode_size, size/2 - electrode_size/2), # 左侧，垂直居中
+            (size + gap, size/2 - electrode_size/2),            # 右侧，垂直居中
+            (size/2 - electrode_size/2, -gap - electrode_size), # 下侧，水平居中
+            (size/2 - electrode_size/2, size + gap)             # 上侧，水平居中
+        ]) + np.asarray(proof_mass_center)
+        
+        return [(x, y, electrode_size, electrode_size, layer_tuple) for x, y in electrode_positions.tolist()]
     
-    def create_metal_routing(self, c: gf.Component, params: Dict[str, float], 
-                            proof_mass_center: Tuple[float, float] = (0, 0)) -> List[gf.Component]:
-        """创建金属布线"""
-        routing = []
-        size = params["proof_mass_size"]
-        spring_length = params["spring_length"]
+    def create_electrodes(self, c: gf.Component, params: ParamsLike, 
+                          proof_mass_center: Tuple[float, float] = (0, 0)) -> List:
+        """创建检测电极"""
+        return _add_rects(c, self._electrode_rects(AccelParams.from_params(params), proof_mass_center))
+    
+    def _routing_rects(self, params: AccelParams, 
+                       proof_mass_center: Tuple[float, float] = (0, 0)) -> List[Rect]:
+        """焊盘和金属布线的矩形"""
+        size = params.proof_mass_size
+        spring_length = params.spring_length
         
         # 使用键合焊盘和布线的特定层定义
-        bond_pad_info = self.layer_defs.get_layer_info("bond_pad")
-        routing_info = self.layer_defs.get_layer_info("routing")
-        
-        bond_pad_size = 200  # μm
-        routing_width = 20   # μm
+        pad_layer = self._layer_tuple["bond_pad"]  # 使用 bond_pad 层
+        route_layer = self._layer_tuple["routing"]  # 使用 routing 层
         
         # 四个焊盘位置 (这些坐标是焊盘矩形的左下角)
-        pad_positions = [
-            (proof_mass_center[0] - spring_length - 300 - bond_pad_size, proof_mass_center[1] - 300 - bond_pad_size),  # 左下
-            (proof_mass_center[0] + size + spring_length + 100, proof_mass_center[1] - 300 - bond_pad_size),  # 右下
-            (proof_mass_center[0] - spring_length - 300 - bond_pad_size, proof_mass_center[1] + size + 100),  # 左上
-            (proof_mass_center[0] + size + spring_length + 100, proof_mass_center[1] + size + 100)  # 右上
-        ]
-        
-        for i, (pad_x, pad_y) in enumerate(pad_positions):
-            # 焊盘
-            pad = c.add_ref(
-                gf.components.rectangle(
-                    size=(bond_pad_size, bond_pad_size),
-                    layer=(bond_pad_info.layer_number, bond_pad_info.datatype) # 使用 bond_pad 层
-                )
-            ).move((pad_x, pad_y))
-            routing.append(pad)
-            
-            # 布线 (简化为从焊盘边缘延伸的固定长度布线)
-            if i == 0:  # 左下焊盘: 布线向右延伸
-                route = c.add_ref(
-                    gf.components.rectangle(
-                        size=(300, routing_width),
-                        layer=(routing_info.layer_number, routing_info.datatype) # 使用 routing 层
-                    )
-                ).move((pad_x + bond_pad_size, pad_y + bond_pad_size/2 - routing_width/2))
-            elif i == 1: # 右下焊盘: 布线向左延伸
-                 route = c.add_ref(
-                    gf.components.rectangle(
-                        size=(300, routing_width),
-                        layer=(routing_info.layer_number, routing_info.datatype)
-                    )
-                ).move((pad_x - 300, pad_y + bond_pad_size/2 - routing_width/2))
-            elif i == 2: # 左上焊盘: 布线向右延伸
-                route = c.add_ref(
-                    gf.components.rectangle(
-                        size=(300, routing_width),
-                        layer=(routing_info.layer_number, routing_info.datatype)
-                    )
-                ).move((pad_x + bond_pad_size, pad_y + bond_pad_size/2 - routing_width/2))
-            else:  # 右上焊盘: 布线向左延伸
-                route = c.add_ref(
-                    gf.components.rectangle(
-                        size=(300, routing_width),
-                        layer=(routing_info.layer_number, routing_info.datatype)
-                    )
-                ).move((pad_x - 300, pad_y + bond_pad_size/2 - routing_width/2))
-            
-            routing.append(route)
-        
-        return routing
+        pad_positions = np.array([
+            (-spring_length - 300 - BOND_PAD_SIZE, -300 - BOND_PAD_SIZE),  # 左下
+            (size + spring_length + 100, -300 - BOND_PAD_SIZE),            # 右下
+            (-spring_length - 300 - BOND_PAD_SIZE, size + 100),            # 左上
+            (size + spring_length + 100, size + 100)                       # 右上
+        ]) + np.asarray(proof_mass_center)
+        
+        # 布线 (简化为从焊盘边缘延伸的固定长度布线)，左下角相对焊盘左下角的偏移：
+        # 左侧焊盘布线向右延伸，右侧焊盘布线向左延伸，竖直方向在焊盘内居中
+        route_positions = pad_positions + np.array([
+            (BOND_PAD_SIZE, BOND_PAD_SIZE/2 - ROUTING_WIDTH/2),  # 左下焊盘
+            (-ROUTING_LENGTH, BOND_PAD_SIZE/2 - ROUTING_WIDTH/2),  # 右下焊盘
+            (BOND_PAD_SIZE, BOND_PAD_SIZE/2 - ROUTING_WIDTH/2),  # 左上焊盘
+            (-ROUTING_LENGTH, BOND_PAD_SIZE/2 - ROUTING_WIDTH/2)   # 右上焊盘
+        ])
+        
+        # 每个焊盘对应一个焊盘矩形和一段布线，共 8 个
+        rects = [None] * 8
+        rects[0::2] = [(x, y, BOND_PAD_SIZE, BOND_PAD_SIZE, pad_layer) for x, y in pad_positions.tolist()]
+        rects[1::2] = [(x, y, ROUTING_LENGTH, ROUTING_WIDTH, route_layer) for x, y in route_positions.tolist()]
+        
+        return rects
     
-    def create_vias(self, c: gf.Component, params: Dict[str, float], 
-                    proof_mass_center: Tuple[float, float] = (0, 0)) -> List[gf.Component]:
-        """创建通孔"""
-        vias = []
-        via_size = params["via_size"]
+    def create_metal_routing(self, c: gf.Component, params: ParamsLike, 
+                            proof_mass_center: Tuple[float, float] = (0, 0)) -> List:
+        """创建金属布线"""
+        return _add_rects(c, self._routing_rects(AccelParams.from_params(params), proof_mass_center))
+    
+    def _via_rects(self, params: AccelParams, 
+                   proof_mass_center: Tuple[float, float] = (0, 0),
+                   anchor_positions: Optional[np.ndarray] = None) -> List[Rect]:
+        """锚点处通孔的矩形"""
+        via_size = params.via_size
         
-        via_info = self.layer_defs.get_layer_info("via")
-        layer_tuple = (via_info.layer_number, via_info.datatype)
+        layer_tuple = self._layer_tuple["via"]
         
         # 在锚点位置添加通孔
-        anchor_size = params["anchor_size"]
-        spring_length = params["spring_length"]
-        size = params["proof_mass_size"]
+        if anchor_positions is None:
+            anchor_positions = self._anchor_positions(params, proof_mass_center)
         
         # 通孔中心位置 (与锚点中心对齐)
-        via_positions_center = [
-            (proof_mass_center[0] - spring_length - anchor_size/2, proof_mass_center[1] - anchor_size/2),  # 左下锚点中心
-            (proof_mass_center[0] + size + spring_length + anchor_size/2, proof_mass_center[1] - anchor_size/2),          # 右下锚点中心
-            (proof_mass_center[0] - spring_length - anchor_size/2, proof_mass_center[1] + size + anchor_size/2),          # 左上锚点中心
-            (proof_mass_center[0] + size + spring_length + anchor_size/2, proof_mass_center[1] + size + anchor_size/2)                   # 右上锚点中心
-        ]
-        
-        for dx, dy in via_positions_center:
-            via = c.add_ref(
-                gf.components.rectangle(
-                    size=(via_size, via_size),
-                    layer=layer_tuple
-                )
-            ).move((dx - via_size/2, dy - via_size/2)) # 移动以使矩形中心位于 (dx, dy)
-            vias.append(via)
+        via_positions_center = anchor_positions + params.anchor_size/2
         
-        return vias
+        # 左下角 = 中心 - via_size/2，使矩形中心位于通孔中心
+        via_corners = via_positions_center - via_size/2
+        return [(x, y, via_size, via_size, layer_tuple) for x, y in via_corners.tolist()]
     
-    def create_alignment_marks(self, c: gf.Component, params: Dict[str, float], 
-                              proof_mass_center: Tuple[float, float] = (0, 0)) -> List[gf.Component]:
-        """创建对准标记"""
-        marks = []
-        size = params["proof_mass_size"]
-        spring_length = params["spring_length"]
+    def create_vias(self, c: gf.Component, params: ParamsLike, 
+                    proof_mass_center: Tuple[float, float] = (0, 0)) -> List:
+        """创建通孔"""
+        return _add_rects(c, self._via_rects(AccelParams.from_params(params), proof_mass_center))
+    
+    def _add_alignment_marks(self, c: gf.Component, params: AccelParams, 
+                             proof_mass_center: Tuple[float, float] = (0, 0)):
+        """放置四个角的十字对准标记"""
+        size = params.proof_mass_size
+        spring_length = params.spring_length
         
-        align_info = self.layer_defs.get_layer_info("alignment")
-        layer_tuple = (align_info.layer_number, align_info.datatype)
+        layer_tuple = self._layer_tuple["alignment"]
         
         # 四个角的对准标记
-        mark_size = 100  # μm
-        mark_line_width = 20 # μm
-        
-        # 标记位置 (这些坐标是标记区域的左下角)
-        mark_positions = [
-            (proof_mass_center[0] - spring_length - 400 - mark_size, proof_mass_center[1] - 400 - mark_size),  # 左下
-            (proof_mass_center[0] + size + spring_length + 200, proof_mass_center[1] - 400 - mark_size),  # 右下
-            (proof_mass_center[0] - spring_length - 400 - mark_size, proof_mass_center[1] + size + 200),  # 左上
-            (proof_mass_center[0] + size + spring_length + 200, proof_mass_center[1] + size + 200)  # 右上
+        # 左下标记区域的左下角；四个标记在 x、y 方向上各按固定间距排列，构成 2x2 网格
+        x0 = proof_mass_center[0] - spring_length - 400 - MARK_SIZE
+        y0 = proof_mass_center[1] - 400 - MARK_SIZE
+        pitch_x = size + 2 * spring_length + 600 + MARK_SIZE
+        pitch_y = size + 600 + MARK_SIZE
+        
+        # 十字单元只创建一次，四个标记作为一个阵列引用放置
+        return c.add_array(
+            _alignment_cross(MARK_SIZE, MARK_LINE_WIDTH, layer_tuple),
+            columns=2,
+            rows=2,
+            spacing=(pitch_x, pitch_y)
+        ).move((x0, y0))
+    
+    def create_alignment_marks(self, c: gf.Component, params: ParamsLike, 
+                              proof_mass_center: Tuple[float, float] = (0, 0)):
+        """创建对准标记"""
+        return self._add_alignment_marks(c, AccelParams.from_params(params), proof_mass_center)
+    
+    def _dicing_rects(self, params: AccelParams, 
+                      proof_mass_center: Tuple[float, float] = (0, 0),
+                      derived: Optional[_Derived] = None) -> List[Rect]:
+        """四条切割线的矩形"""
+        if derived is None:
+            derived = _derived_dims(params)
+        chip_size_full = derived.chip_size
+
+        layer_tuple = self._layer_tuple["dicing"]
+        
+        # 切割线均与坐标轴平行，尺寸直接由 chip_size_full 决定，无需按端点计算长度和角度
+        # (左下角 x, 左下角 y, 是否水平)：顶部、底部、左侧、右侧
+        half = chip_size_full / 2
+        line_specs = [
+            (proof_mass_center[0] - half, proof_mass_center[1] + half - DICING_THICKNESS / 2, True),
+            (proof_mass_center[0] - half, proof_mass_center[1] - half - DICING_THICKNESS / 2, True),
+            (proof_mass_center[0] - half - DICING_THICKNESS / 2, proof_mass_center[1] - half, False),
+            (proof_mass_center[0] + half - DICING_THICKNESS / 2, proof_mass_center[1] - half, False)
         ]
         
-        for mark_x, mark_y in mark_positions:
-            # 十字对准标记
-            # 水平条 (在 mark_size x mark_size 区域内居中)
-            mark_h = c.add_ref(
-                gf.components.rectangle(
-                    size=(mark_size, mark_line_width),
-                    layer=layer_tuple
-                )
-            ).move((mark_x, mark_y + mark_size/2 - mark_line_width/2))
-            
-            # 垂直条 (在 mark_size x mark_size 区域内居中)
-            mark_v = c.add_ref(
-                gf.components.rectangle(
-                    size=(mark_line_width, mark_size),
-                    layer=layer_tuple
-                )
-            ).move((mark_x + mark_size/2 - mark_line_width/2, mark_y))
-            
-            marks.extend([mark_h, mark_v])
+        rects = [None] * len(line_specs)
+        for i, (x, y, horizontal) in enumerate(line_specs):
+            if horizontal:
+                rects[i] = (x, y, chip_size_full, DICING_THICKNESS, layer_tuple)
+            else:
+                rects[i] = (x, y, DICING_THICKNESS, chip_size_full, layer_tuple)
         
-        return marks
+        return rects
     
-    def create_dicing_lines(self, c: gf.Component, params: Dict[str, float], 
-                           proof_mass_center: Tuple[float, float] = (0, 0)) -> List[gf.Component]:
+    def create_dicing_lines(self, c: gf.Component, params: ParamsLike, 
+                           proof_mass_center: Tuple[float, float] = (0, 0)) -> List:
         """创建切割线"""
-        dicing = []
-        size = params["proof_mass_size"]
-        spring_length = params["spring_length"]
-        bond_pad_size = 200 # For chip_size calculation
-
-        dicing_info = self.layer_defs.get_layer_info("dicing")
-        layer_tuple = (dicing_info.layer_number, dicing_info.datatype)
+        return _add_rects(c, self._dicing_rects(AccelParams.from_params(params), proof_mass_center))
+    
+    def _seal_ring_rects(self, params: AccelParams, 
+                         proof_mass_center: Tuple[float, float] = (0, 0),
+                         derived: Optional[_Derived] = None) -> List[Rect]:
+        """密封环的四条边框矩形"""
+        if derived is None:
+            derived = _derived_dims(params)
         
-        # 芯片边界 - 应该定义芯片的外部极限
-        # 考虑所有组件的最大范围来计算芯片尺寸
-        # 假设芯片中心与 proof_mass_center 对齐
-        chip_edge_distance_from_center = max(size/2 + spring_length + 300 + bond_pad_size/2 + 300, 1000) # 约芯片尺寸的一半
-        chip_size_full = chip_edge_distance_from_center * 2
+        layer_tuple = self._layer_tuple["seal_ring"]
         
-        line_thickness = 50 # μm 切割线厚度
-
-        # 水平切割线 (顶部和底部)
-        # 顶部线: 中心在 (0, chip_size_full/2)
-        top_dicing_line = c.add_ref(
-            gf.components.rectangle(
-                size=(chip_size_full, line_thickness),
-                layer=layer_tuple
-            )
-        ).move((proof_mass_center[0] - chip_size_full / 2, 
-               proof_mass_center[1] + chip_size_full / 2 - line_thickness / 2))
-        dicing.append(top_dicing_line)
-
-        # 底部线: 中心在 (0, -chip_size_full/2)
-        bottom_dicing_line = c.add_ref(
-            gf.components.rectangle(
-                size=(chip_size_full, line_thickness),
-                layer=layer_tuple
-            )
-        ).move((proof_mass_center[0] - chip_size_full / 2, 
-               proof_mass_center[1] - chip_size_full / 2 - line_thickness / 2))
-        dicing.append(bottom_dicing_line)
-
-        # 垂直切割线 (左侧和右侧)
-        # 左侧线: 中心在 (-chip_size_full/2, 0)
-        left_dicing_line = c.add_ref(
-            gf.components.rectangle(
-                size=(line_thickness, chip_size_full),
-                layer=layer_tuple
-            )
-        ).move((proof_mass_center[0] - chip_size_full / 2 - line_thickness / 2, 
-               proof_mass_center[1] - chip_size_full / 2))
-        dicing.append(left_dicing_line)
-
-        # 右侧线: 中心在 (chip_size_full/2, 0)
-        right_dicing_line = c.add_ref(
-            gf.components.rectangle(
-                size=(line_thickness, chip_size_full),
-                layer=layer_tuple
-            )
-        ).move((proof_mass_center[0] + chip_size_full / 2 - line_thickness / 2, 
-               proof_mass_center[1] - chip_size_full / 2))
-        dicing.append(right_dicing_line)
-        
-        return dicing
+        # 密封环位于切割线内部，外边长由芯片尺寸减去裕度得到
+        return _frame_rects(proof_mass_center, derived.ring_size, SEAL_RING_WIDTH, layer_tuple)
     
-    def create_seal_ring(self, c: gf.Component, params: Dict[str, float], 
-                         proof_mass_center: Tuple[float, float] = (0, 0)) -> gf.Component:
+    def create_seal_ring(self, c: gf.Component, params: ParamsLike, 
+                         proof_mass_center: Tuple[float, float] = (0, 0)) -> List:
         """创建密封环"""
-        size = params["proof_mass_size"]
-        spring_length = params["spring_length"]
-        bond_pad_size = 200 # For outer_ring_edge calculation
-        
-        seal_info = self.layer_defs.get_layer_info("seal_ring")
-        layer_tuple = (seal_info.layer_number, seal_info.datatype)
-        
-        ring_width = 100  # μm
-        
-        # 计算密封环的外部尺寸。它应该位于切割线内部，并留有一些裕度。
-        # 假设其外边缘距离芯片中心与 dicing line 保持一致，再减去一些裕度。
-        chip_edge_distance_from_center = max(size/2 + spring_length + 300 + bond_pad_size/2 + 300, 1000)
-        outer_ring_dim = chip_edge_distance_from_center * 2 - 200 # 距离芯片边缘 100um 的裕度，两边共200um
-        
-        # 创建外部矩形
-        outer_rect = gf.components.rectangle(
-            size=(outer_ring_dim, outer_ring_dim),
-            layer=layer_tuple
-        ).move((proof_mass_center[0] - outer_ring_dim / 2, proof_mass_center[1] - outer_ring_dim / 2))
-        
-        # 创建用于减法的内部矩形
-        inner_ring_dim = outer_ring_dim - 2 * ring_width
-        inner_rect = gf.components.rectangle(
-            size=(inner_ring_dim, inner_ring_dim),
-            layer=layer_tuple
-        ).move((proof_mass_center[0] - inner_ring_dim / 2, proof_mass_center[1] - inner_ring_dim / 2))
-        
-        # 执行布尔减法以创建环
-        seal_ring_component = gf.boolean(outer_rect, inner_rect, 'A-B', layer=layer_tuple)
-        c.add_ref(seal_ring_component)
-        
-        return seal_ring_component
+        return _add_rects(c, self._seal_ring_rects(AccelParams.from_params(params), proof_mass_center))
+    
+    def _guard_ring_rects(self, params: AccelParams, 
+                          proof_mass_center: Tuple[float, float] = (0, 0),
+                          derived: Optional[_Derived] = None) -> List[Rect]:
+        """保护环的四条边框矩形"""
+        if derived is None:
+            derived = _derived_dims(params)
+        
+        layer_tuple = self._layer_tuple["guard_ring"]
+        
+        # 保护环位于密封环内部
+        return _frame_rects(proof_mass_center, derived.guard_size, GUARD_RING_WIDTH, layer_tuple)
     
-    def create_guard_ring(self, c: gf.Component, params: Dict[str, float], 
-                          proof_mass_center: Tuple[float, float] = (0, 0)) -> gf.Component:
+    def create_guard_ring(self, c: gf.Component, params: ParamsLike, 
+                          proof_mass_center: Tuple[float, float] = (0, 0)) -> List:
         """创建保护环"""
-        size = params["proof_mass_size"]
-        spring_length = params["spring_length"]
-        bond_pad_size = 200 # For outer_ring_edge calculation
-        
-        guard_info = self.layer_defs.get_layer_info("guard_ring")
-        layer_tuple = (guard_info.layer_number, guard_info.datatype)
-        
-        guard_width = 50  # μm
-        
-        # 保护环尺寸逻辑，应位于密封环内部。
-        # 假设其外边缘距离芯片中心与 seal ring 保持一致，再减去一些裕度。
-        chip_edge_distance_from_center = max(size/2 + spring_length + 300 + bond_pad_size/2 + 300, 1000)
-        seal_ring_outer_edge_from_center = chip_edge_distance_from_center - 100 # From seal_ring calculation (half dim)
-        guard_outer_dim = (seal_ring_outer_edge_from_center - 50) * 2 # 距离密封环内边缘 50um
-        
-        # 创建外部矩形
-        outer_rect = gf.components.rectangle(
-            size=(guard_outer_dim, guard_outer_dim),
-            layer=layer_tuple
-        ).move((proof_mass_center[0] - guard_outer_dim / 2, proof_mass_center[1] - guard_outer_dim / 2))
-        
-        # 创建用于减法的内部矩形
-        inner_guard_dim = guard_outer_dim - 2 * guard_width
-        inner_rect = gf.components.rectangle(
-            size=(inner_guard_dim, inner_guard_dim),
-            layer=layer_tuple
-        ).move((proof_mass_center[0] - inner_guard_dim / 2, proof_mass_center[1] - inner_guard_dim / 2))
-        
-        # 执行布尔减法以创建环
-        guard_ring_component = gf.boolean(outer_rect, inner_rect, 'A-B', layer=layer_tuple)
-        c.add_ref(guard_ring_component)
-        
-        return guard_ring_component
+        return _add_rects(c, self._guard_ring_rects(AccelParams.from_params(params), proof_mass_center))
     
-    def create_text_labels(self, c: gf.Component, params: Dict[str, float], 
+    def create_text_labels(self, c: gf.Component, params: ParamsLike, 
                           proof_mass_center: Tuple[float, float] = (0, 0)) -> List[gf.Component]:
         """创建文字标记"""
-        labels = []
-        size = params["proof_mass_size"]
-        spring_length = params["spring_length"]
+        params = AccelParams.from_params(params)
+        size = params.proof_mass_size
+        spring_length = params.spring_length
         
-        text_info = self.layer_defs.get_layer_info("text")
-        layer_tuple = (text_info.layer_number, text_info.datatype)
+        layer_tuple = self._layer_tuple["text"]
         
         # 添加设计信息文字
         text_elements_pos = [
@@ -449,42 +451,74 @@ class AccelerometerLayoutGenerator:
             ("V1.0", (proof_mass_center[0], proof_mass_center[1] + size + spring_length + 200))
         ]
         
-        text_size = 50 # 文字大小 (μm)
-        
-        for text_str, (x_pos, y_pos) in text_elements_pos:
-            text_comp = gf.components.text(text_str, size=text_size, layer=layer_tuple)
+        labels = [None] * len(text_elements_pos)
+        for i, (text_str, (x_pos, y_pos)) in enumerate(text_elements_pos):
+            text_comp, text_extent = _text_cell(text_str, TEXT_SIZE, layer_tuple)
             
-            # 计算文字的边界框以进行精确居中
-            text_bbox = text_comp.bbox
-            if text_bbox is not None:
-                text_width = text_bbox[1][0] - text_bbox[0][0]
-                text_height = text_bbox[1][1] - text_bbox[0][1]
+            # 按文字的边界框尺寸进行精确居中
+            if text_extent is not None:
+                text_width, text_height = text_extent
                 centered_text = c.add_ref(text_comp).move((x_pos - text_width / 2, y_pos - text_height / 2))
             else: # 防止空字符串等情况导致 bbox 为 None
                 centered_text = c.add_ref(text_comp).move((x_pos, y_pos))
             
-            labels.append(centered_text)
+            labels[i] = centered_text
         
         return labels
     
-    def generate_accelerometer_layout(self, params: Dict[str, float]) -> gf.Component:
-        """生成完整的加速度计版图"""
+    def _collect_rects(self, params: AccelParams, 
+                       center: Tuple[float, float] = (0, 0)) -> List[Rect]:
+        """收集质量块、弹簧、锚点、电极、布线、通孔、切割线和密封/保护环的全部矩形，不触及 Component"""
+        # 各部件的矩形互不依赖，逐个追加到同一个列表，最后统一写入
+        rects = []
+        for build in (self._proof_mass_rects, self._spring_rects,
+                      self._electrode_rects, self._routing_rects):
+            rects.extend(build(params, center))
+        
+        # 锚点和其上的通孔共用同一组锚点位置
+        anchor_positions = self._anchor_positions(params, center)
+        rects.extend(self._anchor_rects(params, center, anchor_positions))
+        rects.extend(self._via_rects(params, center, anchor_positions))
+        
+        # 切割线、密封环和保护环共用的芯片级尺寸只算一次
+        derived = _derived_dims(params)
+        for build in (self._dicing_rects, self._seal_ring_rects, self._guard_ring_rects):
+            rects.extend(build(params, center, derived))
+        
+        return rects
+    
+    def generate_accelerometer_layout(self, params: ParamsLike) -> gf.Component:
+        """生成完整的加速度计版图，相同参数直接返回已生成的 Component"""
+        return self._build_layout(AccelParams.from_params(params))
+    
+    def _build_layout(self, params: AccelParams) -> gf.Component:
+        """按几何参数构建加速度计版图"""
         c = gf.Component("Accelerometer")
         
         # 中心位置
         center = (0, 0) 
         
-        # 创建各个组件
-        self.create_proof_mass(c, params, center)
-        self.create_springs(c, params, center)
-        self.create_anchors(c, params, center)
-        self.create_electrodes(c, params, center)
-        self.create_metal_routing(c, params, center)
-        self.create_vias(c, params, center)
-        self.create_alignment_marks(c, params, center)
-        self.create_dicing_lines(c, params, center)
-        self.create_seal_ring(c, params, center) 
-        self.create_guard_ring(c, params, center) 
+        # 所有简单矩形先全部收集，再一次性写入多边形
+        _add_rects(c, self._collect_rects(params, center))
+        
+        # 质量块减重孔和对准标记为重复单元，保留阵列引用
+        self._add_proof_mass_holes(c, params, center)
+        self._add_alignment_marks(c, params, center)
+        
+        # 文字标记需要字体，单独放置
         self.create_text_labels(c, params, center)
         
-        return c
\ No newline at end of file
+        return c
+    
+    def generate_accelerometer_wafer(self, params: ParamsLike, rows: int, cols: int,
+                                     step_x: float, step_y: float) -> gf.Component:
+        """生成晶圆级步进版图：单个器件只生成一次，以阵列引用放置 rows x cols 个"""
+        if rows < 1 or cols < 1:
+            raise ValueError(f"阵列行列数必须至少为 1 (rows={rows}, cols={cols})")
+        
+        die = self.generate_accelerometer_layout(params)
+        
+        wafer = gf.Component("Wafer")
+        wafer.add_array(die, columns=cols, rows=rows, spacing=(step_x, step_y))
+        
+        return wafer
@@ -3,30 +3,48 @@ MEMS IMU Theory Calculations
 包含完整的IMU器件物理理论推导和参数计算
 """
 
+import functools
+import math
 import numpy as np
 from typing import Dict, Tuple
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IMUPerformanceParams:
-    """IMU性能参数类"""
+    """IMU性能参数类 (不可变，可作为缓存键)"""
+    
     sensitivity: float  # 灵敏度 (mV/g)
     bandwidth: float    # 带宽 (Hz)
     noise_density: float  # 噪声密度 (μg/√Hz)
     full_scale_range: float  # 量程 (g)
     resolution: float   # 分辨率 (mg)
     power_consumption: float  # 功耗 (mW)
-    
-@dataclass
+
+
+# 掩膜参数迭代优化的最大迭代次数与收敛阈值 (比率与 1 的最大偏差)
+_MAX_ITERATIONS = 10
+_CONVERGENCE_TOL = 1e-3
+_TWO_PI = 2 * math.pi
+
+
+def _as_result(value):
+    """标量输入返回 float，ndarray 输入原样返回数组 (便于批量扫描设计空间)"""
+    return float(value) if np.ndim(value) == 0 else value
+
+@dataclass(slots=True, frozen=True)
 class MaterialProperties:
-    """材料属性类"""
+    """材料属性类 (不可变: 计算器在初始化时据此预计算刚度/质量系数)"""
+    
     youngs_modulus: float  # 杨氏模量 (GPa)
     density: float         # 密度 (kg/m³)
     poisson_ratio: float   # 泊松比
     thickness: float       # 厚度 (μm)
 
 class IMUTheoryCalculator:
-    """IMU理论计算器"""
+    """
+    IMU理论计算器
+    各 calculate_* 公式既接受标量也接受同形状的 ndarray (逐元素计算)。
+    """
     
     def __init__(self):
         # 硅材料属性 (单晶硅)
@@ -40,6 +58,28 @@ class IMUTheoryCalculator:
         # 空气阻尼系数
         self.air_viscosity = 1.81e-5  # Pa·s
         
+        # 物理常数
+        self._eps0 = 8.85e-12  # 真空介电常数 (F/m)
+        self._kb = 1.38e-23    # 玻尔兹曼常数 (J/K)
+        
+        # 与几何无关的不变量，预先计算一次:
+        # k_total = _K0 * w / L³ (四根弹簧并联)，mass = _mass_coeff * size²
+        t_m = self.silicon.thickness * 1e-6
+        self._K0 = 4 * self.silicon.youngs_modulus * 1e9 * t_m**3 / 12
+        self._mass_coeff = self.silicon.density * t_m
+        
+        # 掩膜参数只取决于 (不可变的) 性能参数，按实例缓存优化结果
+        self._cached_mask_parameters = functools.lru_cache(maxsize=512)(
+            self._compute_mask_parameters)
+        
+    def _stiffness_and_mass(self, proof_mass_size, spring_length, spring_width):
+        """返回 (总刚度 N/m, 质量 kg)，输入为微米"""
+        spring_length_m = spring_length * 1e-6
+        proof_mass_size_m = proof_mass_size * 1e-6
+        k_total = self._K0 * (spring_width * 1e-6) / (spring_length_m * spring_length_m * spring_length_m)
+        mass = self._mass_coeff * (proof_mass_size_m * proof_mass_size_m)
+        return k_total, mass
+        
     def calculate_natural_frequency(self, proof_mass_size: float, spring_length: float, 
                                   spring_width: float, spring_thickness: float) -> float:
         """
@@ -69,7 +109,7 @@ class IMUTheoryCalculator:
         # 自然频率 (Hz)
         natural_freq = (1 / (2 * np.pi)) * np.sqrt(k_total / mass)
         
-        return float(natural_freq)
+        return _as_result(natural_freq)
     
     def calculate_sensitivity(self, proof_mass_size: float, spring_length: float,
                            spring_width: float, gap: float, voltage: float) -> float:
@@ -81,27 +121,19 @@ class IMUTheoryCalculator:
         # 转换为米
         proof_mass_size_m = proof_mass_size * 1e-6
         gap_m = gap * 1e-6
-        spring_length_m = spring_length * 1e-6
-        spring_width_m = spring_width * 1e-6
-        spring_thickness_m = self.silicon.thickness * 1e-6 
 
         # 电容面积 (m^2)
         area = proof_mass_size_m**2
         
-        # 真空介电常数
-        epsilon_0 = 8.85e-12  # F/m
-        
         # 弹簧刚度 (N/m)
-        I = spring_width_m * spring_thickness_m**3 / 12
-        k_single = self.silicon.youngs_modulus * 1e9 * I / spring_length_m**3
-        k_total = 4 * k_single
+        k_total, _ = self._stiffness_and_mass(proof_mass_size, spring_length, spring_width)
         
         # 根据给定公式计算灵敏度，确保单位一致性。
         # (F/m * m^2 * V) / (m^2 * N/m) = C/N (库仑/牛顿)
         # 原始代码将其乘以1000得到mV/g，假设这是正确的缩放因子。
-        sensitivity = (epsilon_0 * area * voltage) / (gap_m**2 * k_total)
+        sensitivity = (self._eps0 * area * voltage) / (gap_m**2 * k_total)
         
-        return float(sensitivity * 1000)  # 转换为 mV/g
+        return _as_result(sensitivity * 1000)  # 转换为 mV/g
     
     def calculate_noise(self, proof_mass_size: float, spring_length: float,
                        spring_width: float, gap: float, temperature: float = 300) -> float:
@@ -110,28 +142,15 @@ class IMUTheoryCalculator:
         S_x² = (4 * k_B * T * Q) / (m * ω₀³) (位移噪声公式，转换为加速度噪声)
         所有输入参数期望为微米，在计算中转换为米。
         """
-        # 转换为米
-        proof_mass_size_m = proof_mass_size * 1e-6
-        # spring_length_m = spring_length * 1e-6 # not used here directly
-        # spring_width_m = spring_width * 1e-6 # not used here directly
-        spring_thickness_m = self.silicon.thickness * 1e-6 
-
-        # 玻尔兹曼常数
-        k_b = 1.38e-23  # J/K
-        
-        # 自然频率 (由 calculate_natural_frequency 保证 SI 单位)
-        natural_freq = self.calculate_natural_frequency(proof_mass_size, spring_length, 
-                                                      spring_width, self.silicon.thickness)
-        omega_0 = 2 * np.pi * natural_freq # 角频率 (rad/s)
-        
-        # 质量 (kg)
-        mass = self.silicon.density * proof_mass_size_m**2 * spring_thickness_m
+        # 刚度 (N/m) 与质量 (kg)
+        k_total, mass = self._stiffness_and_mass(proof_mass_size, spring_length, spring_width)
+        omega_0 = np.sqrt(k_total / mass) # 角频率 (rad/s)
         
         # 品质因子 (估算)
         Q = 100  # 典型值
         
         # 热机械位移噪声谱密度 (m/√Hz)
-        noise_density_displacement = np.sqrt((4 * k_b * temperature * Q) / (mass * omega_0**3))
+        noise_density_displacement = np.sqrt((4 * self._kb * temperature * Q) / (mass * omega_0**3))
         
         # 转换为加速度噪声 (m/s^2/√Hz)
         noise_acceleration = noise_density_displacement * omega_0**2 
@@ -139,7 +158,7 @@ class IMUTheoryCalculator:
         # 转换为 μg/√Hz (除以重力加速度 9.81 m/s^2，再乘以 1e6 转换为 μg)
         noise_density_ug_per_sqrt_hz = noise_acceleration / 9.81 * 1e6
 
-        return float(noise_density_ug_per_sqrt_hz)
+        return _as_result(noise_density_ug_per_sqrt_hz)
     
     def calculate_bandwidth(self, proof_mass_size: float, spring_length: float,
                           spring_width: float, damping_ratio: float = 0.7) -> float:
@@ -147,15 +166,15 @@ class IMUTheoryCalculator:
         计算带宽 (Hz)
         BW = f_n / (2 * π * ζ)
         """
-        natural_freq = self.calculate_natural_frequency(proof_mass_size, spring_length,
-                                                      spring_width, self.silicon.thickness)
+        k_total, mass = self._stiffness_and_mass(proof_mass_size, spring_length, spring_width)
+        natural_freq = (1 / (2 * np.pi)) * np.sqrt(k_total / mass)
         
         # 3dB 带宽通常是 f_n / (2 * damping_ratio) 或 f_n * sqrt(1 - 2*zeta^2)
         # 原始公式 BW = f_n / (2 * pi * zeta) 可能指角频率带宽，但评论里是Hz。
         # 为了与原始代码保持一致，保留其形式，并修正其在优化中的使用方式。
         bandwidth = natural_freq / (2 * np.pi * damping_ratio)
         
-        return float(bandwidth)
+        return _as_result(bandwidth)
     
     def calculate_damping_ratio(self, proof_mass_size: float, spring_length: float,
                                 spring_width: float, gap: float) -> float:
@@ -166,27 +185,19 @@ class IMUTheoryCalculator:
         """
         # 转换为米
         proof_mass_size_m = proof_mass_size * 1e-6
-        spring_length_m = spring_length * 1e-6
-        spring_width_m = spring_width * 1e-6
         gap_m = gap * 1e-6
-        spring_thickness_m = self.silicon.thickness * 1e-6
 
         # 估算阻尼系数 (空气阻尼) (N*s/m)
         area_overlap = proof_mass_size_m**2 
         c = self.air_viscosity * area_overlap / gap_m
         
-        # 弹簧刚度 (N/m)
-        I = spring_width_m * spring_thickness_m**3 / 12
-        k_single = self.silicon.youngs_modulus * 1e9 * I / spring_length_m**3
-        k_total = 4 * k_single
-        
-        # 质量 (kg)
-        mass = self.silicon.density * proof_mass_size_m**2 * spring_thickness_m
+        # 弹簧刚度 (N/m) 与质量 (kg)
+        k_total, mass = self._stiffness_and_mass(proof_mass_size, spring_length, spring_width)
         
         # 阻尼比
         damping_ratio = c / (2 * np.sqrt(k_total * mass))
         
-        return float(damping_ratio)
+        return _as_result(damping_ratio)
     
     def calculate_pull_in_voltage(self, proof_mass_size: float, spring_length: float,
                                 spring_width: float, gap: float) -> float:
@@ -198,30 +209,85 @@ class IMUTheoryCalculator:
         # 转换为米
         proof_mass_size_m = proof_mass_size * 1e-6
         gap_m = gap * 1e-6
-        spring_length_m = spring_length * 1e-6
-        spring_width_m = spring_width * 1e-6
-        spring_thickness_m = self.silicon.thickness * 1e-6
 
         # 弹簧刚度 (N/m)
-        I = spring_width_m * spring_thickness_m**3 / 12
-        k_single = self.silicon.youngs_modulus * 1e9 * I / spring_length_m**3
-        k_total = 4 * k_single
+        k_total, _ = self._stiffness_and_mass(proof_mass_size, spring_length, spring_width)
         
         # 电容面积 (m^2)
         area = proof_mass_size_m**2
         
-        # 真空介电常数
-        epsilon_0 = 8.85e-12  # F/m
-        
         # 吸合电压 (V)
-        pull_in_voltage = np.sqrt((8 * k_total * gap_m**3) / (27 * epsilon_0 * area))
+        pull_in_voltage = np.sqrt((8 * k_total * gap_m**3) / (27 * self._eps0 * area))
         
-        return float(pull_in_voltage)
+        return _as_result(pull_in_voltage)
+    
+    def calculate_design_indicators(self, proof_mass_size: float, spring_length: float,
+                                    spring_width: float, gap: float) -> Dict[str, float]:
+        """
+        一次性计算设计指标 (质量块面积、弹簧刚度、自然频率、吸合电压、阻尼比)
+        刚度与质量只计算一次，供各指标共享。
+        所有输入参数期望为微米，在计算中转换为米。
+        """
+        # 转换为米
+        proof_mass_size_m = proof_mass_size * 1e-6
+        gap_m = gap * 1e-6
+        
+        # 弹簧刚度 (N/m)、质量 (kg) 与电容面积 (m^2)
+        k_total, mass = self._stiffness_and_mass(proof_mass_size, spring_length, spring_width)
+        area = proof_mass_size_m**2
+        
+        natural_freq = (1 / (2 * np.pi)) * np.sqrt(k_total / mass)
+        pull_in_voltage = np.sqrt((8 * k_total * gap_m**3) / (27 * self._eps0 * area))
+        damping_ratio = (self.air_viscosity * area / gap_m) / (2 * np.sqrt(k_total * mass))
+        
+        return {
+            "proof_mass_area": _as_result(proof_mass_size**2),  # μm²
+            "spring_stiffness": _as_result(k_total),
+            "natural_freq": _as_result(natural_freq),
+            "pull_in_voltage": _as_result(pull_in_voltage),
+            "damping_ratio": _as_result(damping_ratio)
+        }
+    
+    def _evaluate_design(self, proof_mass_size, spring_length, spring_width, gap, voltage,
+                         temperature: float = 300, damping_ratio: float = 0.7):
+        """
+        一次性计算 (灵敏度 mV/g, 噪声 μg/√Hz, 带宽 Hz, 吸合电压 V)
+        刚度、质量与角频率只计算一次，公式与各 calculate_* 方法一致。
+        仅用于标量优化循环，使用 math 而非 numpy。
+        """
+        # 整数次幂直接写成乘法，避免通用 pow()
+        proof_mass_size_m = proof_mass_size * 1e-6
+        spring_length_m = spring_length * 1e-6
+        gap_m = gap * 1e-6
+        area = proof_mass_size_m * proof_mass_size_m
+        gap_sq = gap_m * gap_m
+        
+        k_total = self._K0 * (spring_width * 1e-6) / (spring_length_m * spring_length_m * spring_length_m)
+        mass = self._mass_coeff * area
+        omega_sq = k_total / mass
+        omega_0 = math.sqrt(omega_sq)
+        
+        sensitivity = (self._eps0 * area * voltage) / (gap_sq * k_total) * 1000
+        
+        Q = 100
+        noise_displacement = math.sqrt((4 * self._kb * temperature * Q) / (mass * omega_sq * omega_0))
+        noise = noise_displacement * omega_sq / 9.81 * 1e6
+        
+        bandwidth = omega_0 / _TWO_PI / (_TWO_PI * damping_ratio)
+        
+        pull_in_voltage = math.sqrt((8 * k_total * gap_sq * gap_m) / (27 * self._eps0 * area))
+        
+        return sensitivity, noise, bandwidth, pull_in_voltage
     
     def calculate_mask_parameters(self, performance_params: IMUPerformanceParams) -> Dict[str, float]:
         """
         根据性能参数计算mask几何参数，通过迭代优化。
+        相同性能参数直接命中缓存，返回副本以免调用方修改缓存内容。
         """
+        return dict(self._cached_mask_parameters(performance_params))
+    
+    def _compute_mask_parameters(self, performance_params: IMUPerformanceParams) -> Dict[str, float]:
+        """迭代优化的实际实现 (结果由 calculate_mask_parameters 缓存)"""
         # 初始估算 (微米单位)
         proof_mass_size = 1000.0  # μm
         spring_length = 300.0     # μm
@@ -229,39 +295,48 @@ class IMUTheoryCalculator:
         gap = 3.0                 # μm
         voltage = 5.0             # V (工作电压)
         
-        # 迭代优化参数
-        for _ in range(10): # 迭代次数
+        # 迭代优化参数 (最多 10 次，收敛或参数不再变化时提前结束)
+        for _ in range(_MAX_ITERATIONS):
             # 计算当前参数下的性能
-            current_sensitivity = self.calculate_sensitivity(proof_mass_size, spring_length,
-                                                          spring_width, gap, voltage)
-            current_noise = self.calculate_noise(proof_mass_size, spring_length,
-                                               spring_width, gap)
-            current_bandwidth = self.calculate_bandwidth(proof_mass_size, spring_length,
-                                                       spring_width)
+            current_sensitivity, current_noise, current_bandwidth, _ = self._evaluate_design(
+                proof_mass_size, spring_length, spring_width, gap, voltage)
+            
+            # 目标性能与当前性能的比率 (当前值为 0 时不调整)
+            sensitivity_ratio = (performance_params.sensitivity / current_sensitivity
+                                 if current_sensitivity != 0 else 1.0)
+            noise_ratio = (performance_params.noise_density / current_noise
+                           if current_noise != 0 else 1.0)
+            bandwidth_ratio = (performance_params.bandwidth / current_bandwidth
+                               if current_bandwidth != 0 else 1.0)
+            
+            # 三项比率都已接近 1，继续迭代的修正量可以忽略
+            if max(abs(sensitivity_ratio - 1), abs(noise_ratio - 1),
+                   abs(bandwidth_ratio - 1)) < _CONVERGENCE_TOL:
+                break
             
-            # 根据目标性能与当前性能的比率调整参数 (启发式调整)
-            if current_sensitivity != 0:
-                sensitivity_ratio = performance_params.sensitivity / current_sensitivity
-                proof_mass_size *= np.sqrt(sensitivity_ratio) # 灵敏度通常与面积成正比
+            previous = (proof_mass_size, spring_length, spring_width)
             
-            if current_noise != 0:
-                noise_ratio = performance_params.noise_density / current_noise
-                spring_width *= np.sqrt(noise_ratio) # 减小噪声可能需要增加弹簧宽度（增加质量，改变刚度）
+            # 根据比率调整参数 (启发式调整)
+            # 开方更新即阻尼系数 0.5 的一阶步长: √r ≈ 1 + 0.5·(r-1)
+            proof_mass_size *= math.sqrt(sensitivity_ratio) # 灵敏度通常与面积成正比
+            spring_width *= math.sqrt(noise_ratio) # 减小噪声可能需要增加弹簧宽度（增加质量，改变刚度）
             
-            if current_bandwidth != 0:
-                bandwidth_ratio = performance_params.bandwidth / current_bandwidth
-                # 带宽与自然频率成正比，自然频率与弹簧长度的-1.5次方成正比 (f_n ~ 1/L^(3/2))
-                # 如果目标带宽更高 (bandwidth_ratio > 1)，需要减小弹簧长度。
-                # 如果目标带宽更低 (bandwidth_ratio < 1)，需要增大弹簧长度。
-                if bandwidth_ratio > 1: # 目标带宽高，减小L
-                    spring_length /= (bandwidth_ratio)**(1/1.5) 
-                elif bandwidth_ratio < 1: # 目标带宽低，增大L
-                    spring_length *= (1/bandwidth_ratio)**(1/1.5)
+            # 带宽与自然频率成正比，自然频率与弹簧长度的-1.5次方成正比 (f_n ~ 1/L^(3/2))
+            # 如果目标带宽更高 (bandwidth_ratio > 1)，需要减小弹簧长度。
+            # 如果目标带宽更低 (bandwidth_ratio < 1)，需要增大弹簧长度。
+            if bandwidth_ratio > 1: # 目标带宽高，减小L
+                spring_length /= (bandwidth_ratio)**(1/1.5) 
+            elif bandwidth_ratio < 1: # 目标带宽低，增大L
+                spring_length *= (1/bandwidth_ratio)**(1/1.5)
             
             # 确保参数在合理范围内
-            proof_mass_size = np.clip(proof_mass_size, 200.0, 2000.0)
-            spring_width = np.clip(spring_width, 5.0, 50.0)
-            spring_length = np.clip(spring_length, 100.0, 500.0)
+            proof_mass_size = min(max(proof_mass_size, 200.0), 2000.0)
+            spring_width = min(max(spring_width, 5.0), 50.0)
+            spring_length = min(max(spring_length, 100.0), 500.0)
+            
+            # 参数被边界卡住不再变化时，后续迭代结果完全相同
+            if (proof_mass_size, spring_length, spring_width) == previous:
+                break
         
         # 计算其他派生参数
         anchor_size = proof_mass_size * 0.2
@@ -269,18 +344,103 @@ class IMUTheoryCalculator:
         trench_width = 5.0 # 假设固定
         via_size = 10.0 # 假设固定
         
+        # 循环只用 math/min/max 运算 Python float，结果无需再 float() 转换
         return {
-            "proof_mass_size": float(proof_mass_size),
-            "spring_length": float(spring_length),
-            "spring_width": float(spring_width),
-            "anchor_size": float(anchor_size),
-            "electrode_size": float(electrode_size),
-            "gap": float(gap),
-            "trench_width": float(trench_width),
-            "via_size": float(via_size),
-            "voltage": float(voltage)
+            "proof_mass_size": proof_mass_size,
+            "spring_length": spring_length,
+            "spring_width": spring_width,
+            "anchor_size": anchor_size,
+            "electrode_size": electrode_size,
+            "gap": gap,
+            "trench_width": trench_width,
+            "via_size": via_size,
+            "voltage": voltage
         }
-    
+
+    def calculate_mask_parameters_batch(self, sensitivity: np.ndarray, noise_density: np.ndarray,
+                                        bandwidth: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        批量计算 N 组目标性能 (长度为 N 的数组) 对应的mask几何参数。
+        三个目标按 NumPy 规则广播，标量目标对所有设计保持不变 (全为标量时按长度 1 处理)。
+        与 calculate_mask_parameters 逐元素等价，各组独立收敛/停止，返回按字段组织的数组字典。
+        """
+        targets = [np.atleast_1d(np.asarray(value, dtype=float))
+                   for value in (sensitivity, noise_density, bandwidth)]
+        try:
+            target_sensitivity, target_noise, target_bandwidth = np.broadcast_arrays(*targets)
+        except ValueError:
+            raise ValueError(
+                "灵敏度、噪声密度、带宽目标的形状无法广播: "
+                + ", ".join(str(target.shape) for target in targets)
+            ) from None
+
+        # 初始估算 (微米单位)，与标量版本一致
+        proof_mass_size = np.full(target_sensitivity.shape, 1000.0)
+        spring_length = np.full(target_sensitivity.shape, 300.0)
+        spring_width = np.full(target_sensitivity.shape, 20.0)
+        gap = 3.0
+        voltage = 5.0
+
+        # 尚未收敛/停止的设计
+        active = np.ones(target_sensitivity.shape, dtype=bool)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for _ in range(_MAX_ITERATIONS):
+                current_sensitivity = self.calculate_sensitivity(proof_mass_size, spring_length,
+                                                                 spring_width, gap, voltage)
+                current_noise = self.calculate_noise(proof_mass_size, spring_length,
+                                                     spring_width, gap)
+                current_bandwidth = self.calculate_bandwidth(proof_mass_size, spring_length,
+                                                             spring_width)
+
+                # 目标性能与当前性能的比率 (当前值为 0 时不调整)
+                sensitivity_ratio = np.where(current_sensitivity != 0,
+                                             target_sensitivity / current_sensitivity, 1.0)
+                noise_ratio = np.where(current_noise != 0, target_noise / current_noise, 1.0)
+                bandwidth_ratio = np.where(current_bandwidth != 0,
+                                           target_bandwidth / current_bandwidth, 1.0)
+
+                error = np.maximum(np.abs(sensitivity_ratio - 1), np.abs(noise_ratio - 1))
+                np.maximum(error, np.abs(bandwidth_ratio - 1), out=error)
+                active &= error >= _CONVERGENCE_TOL
+                if not active.any():
+                    break
+
+                new_size = proof_mass_size * np.sqrt(sensitivity_ratio)
+                new_width = spring_width * np.sqrt(noise_ratio)
+                new_length = np.where(bandwidth_ratio > 1,
+                                      spring_length / bandwidth_ratio**(1/1.5),
+                                      np.where(bandwidth_ratio < 1,
+                                               spring_length * (1/bandwidth_ratio)**(1/1.5),
+                                               spring_length))
+                np.clip(new_size, 200.0, 2000.0, out=new_size)
+                np.clip(new_width, 5.0, 50.0, out=new_width)
+                np.clip(new_length, 100.0, 500.0, out=new_length)
+
+                # 参数不再变化的设计同样停止
+                changed = ((new_size != proof_mass_size) | (new_length != spring_length)
+                           | (new_width != spring_width))
+
+                proof_mass_size = np.where(active, new_size, proof_mass_size)
+                spring_length = np.where(active, new_length, spring_length)
+                spring_width = np.where(active, new_width, spring_width)
+                active &= changed
+                if not active.any():
+                    break
+
+        shape = proof_mass_size.shape
+        return {
+            "proof_mass_size": proof_mass_size,
+            "spring_length": spring_length,
+            "spring_width": spring_width,
+            "anchor_size": proof_mass_size * 0.2,
+            "electrode_size": proof_mass_size * 0.8,
+            "gap": np.full(shape, gap),
+            "trench_width": np.full(shape, 5.0),
+            "via_size": np.full(shape, 10.0),
+            "voltage": np.full(shape, voltage)
+        }
+
     def validate_design(self, mask_params: Dict[str, float]) -> Tuple[bool, str]:
         """
         验证设计是否满足制造约束
@@ -295,15 +455,41 @@ class IMUTheoryCalculator:
         if mask_params["gap"] < min_spacing:
             return False, f"间隙 {mask_params['gap']:.2f} μm 小于最小间距 {min_spacing} μm"
         
-        # 吸合电压检查
+        # 吸合电压检查: 确保吸合电压显著高于工作电压 (安全系数 > 1.5)
+        pull_in_threshold = mask_params["voltage"] * 1.5
+        
+        # 与 calculate_pull_in_voltage 同一公式，直接使用预计算常数内联计算
+        proof_mass_size_m = mask_params["proof_mass_size"] * 1e-6
+        spring_length_m = mask_params["spring_length"] * 1e-6
+        gap_m = mask_params["gap"] * 1e-6
+        k_total = (self._K0 * (mask_params["spring_width"] * 1e-6)
+                   / (spring_length_m * spring_length_m * spring_length_m))
+        area = proof_mass_size_m * proof_mass_size_m
+        pull_in_voltage = math.sqrt((8 * k_total * gap_m * gap_m * gap_m) / (27 * self._eps0 * area))
+        
+        if pull_in_voltage < pull_in_threshold:
+            return False, f"工作电压 {mask_params['voltage']:.2f} V 接近吸合电压 {pull_in_voltage:.2f} V (安全系数不足)"
+        
+        return True, "设计验证通过"
+    
+    def validate_design_batch(self, mask_params: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        批量验证 N 组设计 (如 calculate_mask_parameters_batch 的结果)，检查项与 validate_design 相同。
+        返回 (是否通过的布尔数组, 未通过设计的索引)。
+        """
+        spring_width = np.asarray(mask_params["spring_width"], dtype=float)
+        gap = np.asarray(mask_params["gap"], dtype=float)
+        
+        # 最小线宽 2 μm、最小间距 3 μm
+        ok = (spring_width >= 2.0) & (gap >= 3.0)
+        
+        # 吸合电压安全系数 > 1.5
         pull_in_voltage = self.calculate_pull_in_voltage(
-            mask_params["proof_mass_size"],
-            mask_params["spring_length"],
-            mask_params["spring_width"],
-            mask_params["gap"]
+            np.asarray(mask_params["proof_mass_size"], dtype=float),
+            np.asarray(mask_params["spring_length"], dtype=float),
+            spring_width,
+            gap
         )
-        # 确保吸合电压显著高于工作电压 (安全系数 > 1.5)
-        if pull_in_voltage < mask_params["voltage"] * 1.5:
-            return False, f"工作电压 {mask_params['voltage']:.2f} V 接近吸合电压 {pull_in_voltage:.2f} V (安全系数不足)"
+        ok &= pull_in_voltage >= np.asarray(mask_params["voltage"], dtype=float) * 1.5
         
-        return True, "设计验证通过"
\ No newline at end of file
+        return ok, np.flatnonzero(~ok)
@@ -0,0 +1,13 @@
+"""
+GDS File Writer
+GDS文件写出工具，统一GUI与示例脚本的GDS导出入口
+"""
+
+import os
+
+def write_gds(component, file_path: str) -> str:
+    """将组件写出为GDS文件，返回写出的路径"""
+    file_path = os.fspath(file_path)
+    # gdsfactory 在原生代码中直接流式写文件，这里不再经Python中转字节
+    component.write_gds(file_path)
+    return file_path
@@ -3,229 +3,260 @@ Layout Visualization Module
 版图可视化模块，用于生成和显示版图预览图片
 """
 
+import functools
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.colors import ListedColormap
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import ListedColormap, to_rgba
+from matplotlib.figure import Figure
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import gdsfactory as gf
 
+# 示意多边形的单位模板 (N, 4, 2)：以芯片中心为原点、以结构尺寸为单位
+# 质量块 (层2)
+_MASS_UNIT = np.array([
+    [[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]],
+])
+# 四个弹簧 (层3)：左、右、上、下，长 0.2、宽 0.1
+_SPRING_UNIT = np.array([
+    [[-0.5, -0.05], [-0.3, -0.05], [-0.3, 0.05], [-0.5, 0.05]],
+    [[0.3, -0.05], [0.5, -0.05], [0.5, 0.05], [0.3, 0.05]],
+    [[-0.05, 0.3], [0.05, 0.3], [0.05, 0.5], [-0.05, 0.5]],
+    [[-0.05, -0.5], [0.05, -0.5], [0.05, -0.3], [-0.05, -0.3]],
+])
+# 四个锚点 (层4)：位于四角外侧，边长 0.1
+_ANCHOR_UNIT = np.array([
+    [[-0.6, -0.6], [-0.5, -0.6], [-0.5, -0.5], [-0.6, -0.5]],
+    [[0.5, -0.6], [0.6, -0.6], [0.6, -0.5], [0.5, -0.5]],
+    [[-0.6, 0.5], [-0.5, 0.5], [-0.5, 0.6], [-0.6, 0.6]],
+    [[0.5, 0.5], [0.6, 0.5], [0.6, 0.6], [0.5, 0.6]],
+])
+# 四个电极 (层5)：间隙 0.05、边长 0.2
+_ELECTRODE_UNIT = np.array([
+    [[-0.75, -0.1], [-0.55, -0.1], [-0.55, 0.1], [-0.75, 0.1]],
+    [[0.55, -0.1], [0.75, -0.1], [0.75, 0.1], [0.55, 0.1]],
+    [[-0.1, -0.75], [0.1, -0.75], [0.1, -0.55], [-0.1, -0.55]],
+    [[-0.1, 0.55], [0.1, 0.55], [0.1, 0.75], [-0.1, 0.75]],
+])
+
+# (层号, 结构尺寸占芯片短边的比例, 单位模板)
+_PREVIEW_TEMPLATES = (
+    (2, 0.3, _MASS_UNIT),
+    (3, 0.4, _SPRING_UNIT),
+    (4, 0.4, _ANCHOR_UNIT),
+    (5, 0.3, _ELECTRODE_UNIT),
+)
+
+@functools.lru_cache(maxsize=64)
+def _preview_polygons(x_min: float, y_min: float, x_max: float, y_max: float) -> Tuple:
+    """按边界框生成示意多边形，返回 ((层号, (N, 4, 2) 只读数组), ...)，结果按边界框缓存"""
+    center = np.array([(x_min + x_max) / 2, (y_min + y_max) / 2])
+    extent = min(x_max - x_min, y_max - y_min)
+    
+    result = []
+    for layer, scale, unit in _PREVIEW_TEMPLATES:
+        polygons = unit * (extent * scale) + center
+        assert polygons.shape[-2] >= 3  # 每个多边形至少 3 个顶点，绘制时无需逐个检查
+        polygons.flags.writeable = False  # 缓存共享，禁止调用方修改
+        result.append((layer, polygons))
+    return tuple(result)
+
 class LayoutVisualizer:
     """版图可视化器"""
     
-    def __init__(self):
-        # 定义20种层的颜色映射
-        self.layer_colors = {
-            1: '#808080',   # 硅衬底 - 灰色
-            2: '#FF0000',   # 质量块 - 红色
-            3: '#00FF00',   # 弹簧 - 绿色
-            4: '#0000FF',   # 锚点 - 蓝色
-            5: '#FFFF00',   # 电极 - 黄色
-            6: '#800080',   # 背面刻蚀 - 紫色
-            7: '#008080',   # 正面刻蚀 - 青色
-            8: '#FF8000',   # 释放刻蚀 - 橙色
-            9: '#8000FF',   # 沟槽 - 紫罗兰
-            10: '#FF0080',  # 通孔 - 粉色
-            11: '#FFD700',  # 金属1 - 金色
-            12: '#FFA500',  # 金属2 - 橙色
-            13: '#FF6347',  # 金属3 - 番茄色
-            14: '#32CD32',  # 键合焊盘 - 酸橙绿
-            15: '#87CEEB',  # 布线 - 天蓝色
-            16: '#000000',  # 对准标记 - 黑色
-            17: '#FF0000',  # 切割线 - 红色
-            18: '#8B4513',  # 密封环 - 马鞍棕色
-            19: '#2E8B57',  # 保护环 - 海绿色
-            20: '#696969',  # 文字标记 - 暗灰色
-        }
+    # 定义20种层的颜色映射 (类常量，所有实例共享)
+    LAYER_COLORS = {
+        1: '#808080',   # 硅衬底 - 灰色
+        2: '#FF0000',   # 质量块 - 红色
+        3: '#00FF00',   # 弹簧 - 绿色
+        4: '#0000FF',   # 锚点 - 蓝色
+        5: '#FFFF00',   # 电极 - 黄色
+        6: '#800080',   # 背面刻蚀 - 紫色
+        7: '#008080',   # 正面刻蚀 - 青色
+        8: '#FF8000',   # 释放刻蚀 - 橙色
+        9: '#8000FF',   # 沟槽 - 紫罗兰
+        10: '#FF0080',  # 通孔 - 粉色
+        11: '#FFD700',  # 金属1 - 金色
+        12: '#FFA500',  # 金属2 - 橙色
+        13: '#FF6347',  # 金属3 - 番茄色
+        14: '#32CD32',  # 键合焊盘 - 酸橙绿
+        15: '#87CEEB',  # 布线 - 天蓝色
+        16: '#000000',  # 对准标记 - 黑色
+        17: '#FF0000',  # 切割线 - 红色
+        18: '#8B4513',  # 密封环 - 马鞍棕色
+        19: '#2E8B57',  # 保护环 - 海绿色
+        20: '#696969',  # 文字标记 - 暗灰色
+    }
+    
+    # 层名称映射
+    LAYER_NAMES = {
+        1: "硅衬底",
+        2: "质量块", 
+        3: "弹簧",
+        4: "锚点",
+        5: "电极",
+        6: "背面刻蚀",
+        7: "正面刻蚀",
+        8: "释放刻蚀",
+        9: "沟槽",
+        10: "通孔",
+        11: "金属1",
+        12: "金属2", 
+        13: "金属3",
+        14: "键合焊盘",
+        15: "布线",
+        16: "对准标记",
+        17: "切割线",
+        18: "密封环",
+        19: "保护环",
+        20: "文字标记"
+    }
+    
+    # 按层号索引的 RGBA 表：第 0 行及未定义的层号为默认灰色
+    _LAYER_RGBA = np.tile(to_rgba('#CCCCCC'), (max(LAYER_COLORS) + 1, 1))
+    for _layer, _color in LAYER_COLORS.items():
+        _LAYER_RGBA[_layer] = to_rgba(_color)
+    del _layer, _color
+    
+    @classmethod
+    def _layer_rgba(cls, layer_ids: np.ndarray) -> np.ndarray:
+        """按层号取 RGBA，超出颜色表范围的层号使用默认灰色 (第 0 行)"""
+        return cls._LAYER_RGBA[np.where(layer_ids < len(cls._LAYER_RGBA), layer_ids, 0)]
+    
+    def __init__(self, headless: bool = False):
+        # headless=True 时图形直接用 Figure + Agg 画布创建，不经过 pyplot，
+        # 既不加载 GUI 工具包，也不改变进程内其他代码使用的全局后端
+        self.headless = headless
         
-        # 层名称映射
-        self.layer_names = {
-            1: "硅衬底",
-            2: "质量块", 
-            3: "弹簧",
-            4: "锚点",
-            5: "电极",
-            6: "背面刻蚀",
-            7: "正面刻蚀",
-            8: "释放刻蚀",
-            9: "沟槽",
-            10: "通孔",
-            11: "金属1",
-            12: "金属2", 
-            13: "金属3",
-            14: "键合焊盘",
-            15: "布线",
-            16: "对准标记",
-            17: "切割线",
-            18: "密封环",
-            19: "保护环",
-            20: "文字标记"
-        }
+        # update() 复用的实时预览: (fig, ax, collection, 层号, 比例尺线, 比例尺文字)
+        self._live = None
     
-    def extract_polygons_from_component(self, component: gf.Component) -> Dict[int, List]:
-        """从gdsfactory组件中提取多边形数据"""
-        polygons_by_layer = {}
+    def _subplots(self, *args, **kwargs):
+        """创建图形与坐标轴，参数同 plt.subplots；无界面模式下使用独立的 Agg 画布"""
+        if not self.headless:
+            return plt.subplots(*args, **kwargs)
         
+        fig = Figure(figsize=kwargs.pop('figsize', None),
+                     dpi=kwargs.pop('dpi', None),
+                     constrained_layout=kwargs.pop('constrained_layout', None))
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots(*args, **kwargs)
+    
+    def extract_polygons_from_component(self, component: gf.Component) -> Dict[int, np.ndarray]:
+        """从gdsfactory组件中提取多边形数据，每层为 (N, 4, 2) 顶点数组"""
         # 获取组件的边界框
         bbox = component.bbox
         if bbox is None:
-            return polygons_by_layer
+            return {}
         
         # 修正：解包为[[x_min, y_min], [x_max, y_max]]
         (x_min, y_min), (x_max, y_max) = bbox
         
-        # 为每个层创建矩形
-        for layer_num in range(1, 21):  # 20层
-            if layer_num in [2, 3, 4, 5]:  # 主要结构层
-                # 创建主要结构的多边形
-                polygons = []
-                
-                # 质量块 (层2)
-                if layer_num == 2:
-                    center_x, center_y = (x_min + x_max) / 2, (y_min + y_max) / 2
-                    size = min(x_max - x_min, y_max - y_min) * 0.3
-                    rect = [
-                        [center_x - size/2, center_y - size/2],
-                        [center_x + size/2, center_y - size/2],
-                        [center_x + size/2, center_y + size/2],
-                        [center_x - size/2, center_y + size/2]
-                    ]
-                    polygons.append(rect)
-                
-                # 弹簧 (层3)
-                elif layer_num == 3:
-                    center_x, center_y = (x_min + x_max) / 2, (y_min + y_max) / 2
-                    size = min(x_max - x_min, y_max - y_min) * 0.4
-                    # 四个弹簧
-                    spring_width = size * 0.1
-                    spring_length = size * 0.2
-                    
-                    springs = [
-                        # 左弹簧
-                        [[center_x - size/2, center_y - spring_width/2],
-                         [center_x - size/2 + spring_length, center_y - spring_width/2],
-                         [center_x - size/2 + spring_length, center_y + spring_width/2],
-                         [center_x - size/2, center_y + spring_width/2]],
-                        # 右弹簧
-                        [[center_x + size/2 - spring_length, center_y - spring_width/2],
-                         [center_x + size/2, center_y - spring_width/2],
-                         [center_x + size/2, center_y + spring_width/2],
-                         [center_x + size/2 - spring_length, center_y + spring_width/2]],
-                        # 上弹簧
-                        [[center_x - spring_width/2, center_y + size/2 - spring_length],
-                         [center_x + spring_width/2, center_y + size/2 - spring_length],
-                         [center_x + spring_width/2, center_y + size/2],
-                         [center_x - spring_width/2, center_y + size/2]],
-                        # 下弹簧
-                        [[center_x - spring_width/2, center_y - size/2],
-                         [center_x + spring_width/2, center_y - size/2],
-                         [center_x + spring_width/2, center_y - size/2 + spring_length],
-                         [center_x - spring_width/2, center_y - size/2 + spring_length]]
-                    ]
-                    polygons.extend(springs)
-                
-                # 锚点 (层4)
-                elif layer_num == 4:
-                    center_x, center_y = (x_min + x_max) / 2, (y_min + y_max) / 2
-                    size = min(x_max - x_min, y_max - y_min) * 0.4
-                    anchor_size = size * 0.1
-                    
-                    anchors = [
-                        # 四个锚点
-                        [[center_x - size/2 - anchor_size, center_y - size/2 - anchor_size],
-                         [center_x - size/2, center_y - size/2 - anchor_size],
-                         [center_x - size/2, center_y - size/2],
-                         [center_x - size/2 - anchor_size, center_y - size/2]],
-                        [[center_x + size/2, center_y - size/2 - anchor_size],
-                         [center_x + size/2 + anchor_size, center_y - size/2 - anchor_size],
-                         [center_x + size/2 + anchor_size, center_y - size/2],
-                         [center_x + size/2, center_y - size/2]],
-                        [[center_x - size/2 - anchor_size, center_y + size/2],
-                         [center_x - size/2, center_y + size/2],
-                         [center_x - size/2, center_y + size/2 + anchor_size],
-                         [center_x - size/2 - anchor_size, center_y + size/2 + anchor_size]],
-                        [[center_x + size/2, center_y + size/2],
-                         [center_x + size/2 + anchor_size, center_y + size/2],
-                         [center_x + size/2 + anchor_size, center_y + size/2 + anchor_size],
-                         [center_x + size/2, center_y + size/2 + anchor_size]]
-                    ]
-                    polygons.extend(anchors)
-                
-                # 电极 (层5)
-                elif layer_num == 5:
-                    center_x, center_y = (x_min + x_max) / 2, (y_min + y_max) / 2
-                    size = min(x_max - x_min, y_max - y_min) * 0.3
-                    electrode_size = size * 0.2
-                    gap = size * 0.05
-                    
-                    electrodes = [
-                        # 四个电极
-                        [[center_x - size/2 - gap - electrode_size, center_y - electrode_size/2],
-                         [center_x - size/2 - gap, center_y - electrode_size/2],
-                         [center_x - size/2 - gap, center_y + electrode_size/2],
-                         [center_x - size/2 - gap - electrode_size, center_y + electrode_size/2]],
-                        [[center_x + size/2 + gap, center_y - electrode_size/2],
-                         [center_x + size/2 + gap + electrode_size, center_y - electrode_size/2],
-                         [center_x + size/2 + gap + electrode_size, center_y + electrode_size/2],
-                         [center_x + size/2 + gap, center_y + electrode_size/2]],
-                        [[center_x - electrode_size/2, center_y - size/2 - gap - electrode_size],
-                         [center_x + electrode_size/2, center_y - size/2 - gap - electrode_size],
-                         [center_x + electrode_size/2, center_y - size/2 - gap],
-                         [center_x - electrode_size/2, center_y - size/2 - gap]],
-                        [[center_x - electrode_size/2, center_y + size/2 + gap],
-                         [center_x + electrode_size/2, center_y + size/2 + gap],
-                         [center_x + electrode_size/2, center_y + size/2 + gap + electrode_size],
-                         [center_x - electrode_size/2, center_y + size/2 + gap + electrode_size]]
-                    ]
-                    polygons.extend(electrodes)
-                
-                polygons_by_layer[layer_num] = polygons
+        # 多边形只取决于边界框，保存/显示/详细预览重复调用时直接命中缓存
+        return dict(_preview_polygons(float(x_min), float(y_min), float(x_max), float(y_max)))
+    
+    @staticmethod
+    def _stack_layers(polygons_by_layer: Dict[int, np.ndarray]) -> Tuple[List[int], np.ndarray, np.ndarray]:
+        """按层号顺序拼接各层顶点，返回 (层号, (N, 4, 2) 顶点, 每个多边形的层号)"""
+        layers = sorted(polygons_by_layer)
+        if not layers:
+            return layers, np.empty((0, 4, 2)), np.empty(0, dtype=int)
+        
+        verts = np.concatenate([polygons_by_layer[layer] for layer in layers])
+        layer_ids = np.repeat(layers, [len(polygons_by_layer[layer]) for layer in layers])
+        return layers, verts, layer_ids
+    
+    @staticmethod
+    def _scale_bar(x_min: float, y_min: float, x_max: float, y_max: float, margin: float) -> Tuple:
+        """比例尺几何: 返回 (线段 x, 线段 y, 文字位置, 文字)"""
+        scale_length = max(x_max - x_min, y_max - y_min) * 0.2
+        scale_y = y_min - margin * 0.5
+        return ([x_min, x_min + scale_length], [scale_y, scale_y],
+                (x_min + scale_length/2, scale_y - margin*0.1), f'{scale_length:.0f} μm')
+    
+    def _layer_collection(self, polygons_by_layer: Dict[int, np.ndarray],
+                          rasterize: bool,
+                          visible: Optional[Tuple[float, float, float, float]] = None
+                          ) -> Tuple[Optional[PolyCollection], List[int]]:
+        """
+        所有层合并为一个按层着色的 PolyCollection，返回 (collection 或 None, 绘制的层号)
+        visible=(x_min, y_min, x_max, y_max) 时剔除完全落在该范围之外的多边形。
+        """
+        layers, verts, layer_ids = self._stack_layers(polygons_by_layer)
+        if not layers:
+            return None, layers
         
-        return polygons_by_layer
+        if visible is not None:
+            vx_min, vy_min, vx_max, vy_max = visible
+            poly_min = verts.min(axis=1)
+            poly_max = verts.max(axis=1)
+            mask = ((poly_max[:, 0] >= vx_min) & (poly_min[:, 0] <= vx_max) &
+                    (poly_max[:, 1] >= vy_min) & (poly_min[:, 1] <= vy_max))
+            verts = verts[mask]
+            layer_ids = layer_ids[mask]
+            layers = np.unique(layer_ids).tolist()
+            if not layers:
+                return None, layers
+        
+        colors = self._layer_rgba(layer_ids)
+        collection = PolyCollection(verts,
+                                    facecolors=colors,
+                                    edgecolors='black',
+                                    linewidths=0.5,
+                                    alpha=0.7,
+                                    rasterized=rasterize)
+        return collection, layers
     
     def create_layout_preview(self, component: gf.Component, 
                             title: str = "MEMS IMU Layout Preview",
                             figsize: Tuple[int, int] = (12, 10),
-                            dpi: int = 150) -> plt.Figure:
-        """创建版图预览图片"""
-        
+                            dpi: int = 150,
+                            rasterize: bool = True,
+                            viewport: Optional[Tuple[float, float, float, float]] = None,
+                            cull: bool = True) -> plt.Figure:
+        """
+        创建版图预览图片 (rasterize: 多边形按 dpi 栅格化，坐标轴与文字仍为矢量)
+        viewport=(x_min, y_min, x_max, y_max) 时只显示该区域 (另加边距)，cull 为真时剔除区域外的多边形。
+        """
+        # 创建图形 (constrained_layout 在绘制时完成布局，无需额外的 tight_layout)
+        fig, ax = self._subplots(figsize=figsize, dpi=dpi, constrained_layout=True)
+        self._draw_layout_preview(ax, component, title, rasterize, viewport, cull)
+        return fig
+    
+    def _draw_layout_preview(self, ax: plt.Axes, component: gf.Component,
+                             title: str, rasterize: bool,
+                             viewport: Optional[Tuple[float, float, float, float]] = None,
+                             cull: bool = True) -> Tuple:
+        """在给定坐标轴上绘制版图预览 (多边形、图例、比例尺)，返回 (collection, 层号, 比例尺线, 比例尺文字)"""
         # 提取多边形数据
         polygons_by_layer = self.extract_polygons_from_component(component)
         
-        # 创建图形
-        fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+        # 计算边界: 指定视口时直接使用，否则所有层顶点拼接后一次求 min/max
+        has_bounds = viewport is not None or bool(polygons_by_layer)
+        visible = None
+        if viewport is not None:
+            x_min, y_min, x_max, y_max = viewport
+        elif polygons_by_layer:
+            points = np.concatenate([polygons.reshape(-1, 2) for polygons in polygons_by_layer.values()])
+            x_min, y_min = points.min(axis=0)
+            x_max, y_max = points.max(axis=0)
         
-        # 计算边界
-        all_points = []
-        for layer_polygons in polygons_by_layer.values():
-            for polygon in layer_polygons:
-                all_points.extend(polygon)
-        
-        if len(all_points) > 0:
-            all_points = np.array(all_points)
-            x_min, y_min = all_points.min(axis=0)
-            x_max, y_max = all_points.max(axis=0)
-            
+        if has_bounds:
             # 添加边距
             margin = max(x_max - x_min, y_max - y_min) * 0.1
             ax.set_xlim(x_min - margin, x_max + margin)
             ax.set_ylim(y_min - margin, y_max + margin)
+            
+            # 整体视图下所有多边形都可见，只在指定视口时剔除
+            if viewport is not None and cull:
+                visible = (x_min - margin, y_min - margin, x_max + margin, y_max + margin)
         
         # 绘制各层多边形
-        for layer, polygons in polygons_by_layer.items():
-            color = self.layer_colors.get(layer, '#CCCCCC')
-            layer_name = self.layer_names.get(layer, f"Layer {layer}")
-            
-            for polygon in polygons:
-                if len(polygon) > 2:
-                    # 创建多边形补丁
-                    poly_patch = patches.Polygon(polygon, 
-                                               facecolor=color, 
-                                               edgecolor='black',
-                                               linewidth=0.5,
-                                               alpha=0.7,
-                                               label=layer_name)
-                    ax.add_patch(poly_patch)
+        collection, layers = self._layer_collection(polygons_by_layer, rasterize, visible)
+        if collection is not None:
+            ax.add_collection(collection)
         
         # 设置图形属性
         ax.set_aspect('equal')
@@ -234,121 +265,176 @@ class LayoutVisualizer:
         ax.set_ylabel('Y (μm)', fontsize=12)
         ax.grid(True, alpha=0.3)
         
-        # 添加图例
-        handles, labels = ax.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        if by_label:
-            ax.legend(by_label.values(), by_label.keys(), 
-                     loc='upper right', bbox_to_anchor=(1.15, 1))
+        # 添加图例 (每个已绘制的层一个静态图例项)
+        handles = [patches.Patch(facecolor=self.LAYER_COLORS.get(layer, '#CCCCCC'),
+                                 edgecolor='black',
+                                 alpha=0.7,
+                                 label=self.LAYER_NAMES.get(layer, f"Layer {layer}"))
+                   for layer in layers]
+        if handles:
+            ax.legend(handles=handles, loc='upper right', bbox_to_anchor=(1.15, 1))
         
         # 添加比例尺
-        if len(all_points) > 0:
-            scale_length = max(x_max - x_min, y_max - y_min) * 0.2
-            scale_y = y_min - margin * 0.5
-            ax.plot([x_min, x_min + scale_length], [scale_y, scale_y], 
-                   'k-', linewidth=2, label=f'{scale_length:.0f} μm')
-            ax.text(x_min + scale_length/2, scale_y - margin*0.1, 
-                   f'{scale_length:.0f} μm', ha='center', va='top')
+        scale_line = scale_text = None
+        if has_bounds:
+            xs, ys, text_pos, label = self._scale_bar(x_min, y_min, x_max, y_max, margin)
+            scale_line, = ax.plot(xs, ys, 'k-', linewidth=2, label=label)
+            scale_text = ax.text(*text_pos, label, ha='center', va='top')
+        
+        return collection, layers, scale_line, scale_text
+    
+    def update(self, component: gf.Component,
+               title: str = "MEMS IMU Layout Preview",
+               figsize: Tuple[int, int] = (12, 10),
+               dpi: int = 150,
+               rasterize: bool = True) -> plt.Figure:
+        """
+        重复渲染 (动画/交互) 时复用同一个 Figure 与 PolyCollection，
+        只用 set_verts 更新顶点与颜色；首次调用、图形已关闭或层组合变化时完整绘制。
+        """
+        polygons_by_layer = self.extract_polygons_from_component(component)
+        layers, verts, layer_ids = self._stack_layers(polygons_by_layer)
+        
+        live = self._live
+        if (live is None or live[2] is None or live[3] != layers
+                or not (self.headless or plt.fignum_exists(live[0].number))):
+            # 旧的实时预览不再复用，先关闭以免 pyplot 中残留图形
+            if live is not None:
+                plt.close(live[0])
+            fig, ax = self._subplots(figsize=figsize, dpi=dpi, constrained_layout=True)
+            self._live = (fig, ax) + self._draw_layout_preview(ax, component, title, rasterize)
+            return fig
+        
+        fig, ax, collection, _, scale_line, scale_text = live
+        collection.set_verts(verts)
+        collection.set_facecolor(self._layer_rgba(layer_ids))
         
-        plt.tight_layout()
+        # 边界、边距与比例尺随新的顶点更新
+        points = verts.reshape(-1, 2)
+        x_min, y_min = points.min(axis=0)
+        x_max, y_max = points.max(axis=0)
+        margin = max(x_max - x_min, y_max - y_min) * 0.1
+        ax.set_xlim(x_min - margin, x_max + margin)
+        ax.set_ylim(y_min - margin, y_max + margin)
+        
+        xs, ys, text_pos, label = self._scale_bar(x_min, y_min, x_max, y_max, margin)
+        scale_line.set_data(xs, ys)
+        scale_line.set_label(label)
+        scale_text.set_position(text_pos)
+        scale_text.set_text(label)
+        
+        ax.set_title(title, fontsize=16, fontweight='bold')
+        fig.canvas.draw_idle()
         return fig
     
     def save_layout_preview(self, component: gf.Component, 
                           filename: str = "layout_preview.png",
                           title: str = "MEMS IMU Layout Preview",
                           figsize: Tuple[int, int] = (12, 10),
-                          dpi: int = 150) -> str:
+                          dpi: int = 150,
+                          rasterize: bool = True) -> str:
         """保存版图预览图片"""
-        fig = self.create_layout_preview(component, title, figsize, dpi)
+        fig = self.create_layout_preview(component, title, figsize, dpi, rasterize)
         fig.savefig(filename, dpi=dpi, bbox_inches='tight')
         plt.close(fig)
         return filename
     
+    def save_many(self, components: Sequence[gf.Component],
+                  filenames: Sequence[str],
+                  title: str = "MEMS IMU Layout Preview",
+                  figsize: Tuple[int, int] = (12, 10),
+                  dpi: int = 150,
+                  rasterize: bool = True) -> List[str]:
+        """
+        批量保存版图预览图片，所有组件复用同一个 Figure，避免逐个创建图形的开销
+        返回实际保存的文件名；组件与文件名数量不一致时抛出 ValueError。
+        """
+        if len(components) != len(filenames):
+            raise ValueError(f"组件数量 ({len(components)}) 与文件名数量 ({len(filenames)}) 不一致")
+        
+        saved = []
+        fig, ax = self._subplots(figsize=figsize, dpi=dpi, constrained_layout=True)
+        try:
+            for component, filename in zip(components, filenames):
+                ax.cla()
+                self._draw_layout_preview(ax, component, title, rasterize)
+                fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+                saved.append(filename)
+        finally:
+            plt.close(fig)
+        return saved
+    
     def show_layout_preview(self, component: gf.Component,
                           title: str = "MEMS IMU Layout Preview",
                           figsize: Tuple[int, int] = (12, 10),
                           dpi: int = 150) -> None:
-        """显示版图预览图片"""
-        fig = self.create_layout_preview(component, title, figsize, dpi)
+        """显示版图预览图片 (总是通过 pyplot 当前后端显示，无界面模式下也可使用)"""
+        fig, ax = plt.subplots(figsize=figsize, dpi=dpi, constrained_layout=True)
+        self._draw_layout_preview(ax, component, title, True)
         plt.show()
         plt.close(fig)
     
     def create_detailed_preview(self, component: gf.Component,
                               title: str = "MEMS IMU Detailed Layout",
                               figsize: Tuple[int, int] = (16, 12),
-                              dpi: int = 200) -> plt.Figure:
+                              dpi: int = 200,
+                              rasterize: bool = True) -> plt.Figure:
         """创建详细的版图预览，包含标注"""
         
         # 提取多边形数据
         polygons_by_layer = self.extract_polygons_from_component(component)
         
-        # 创建图形
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize, dpi=dpi)
-        
-        # 计算边界
-        all_points = []
-        for layer_polygons in polygons_by_layer.values():
-            for polygon in layer_polygons:
-                all_points.extend(polygon)
+        # 创建图形 (两图共享坐标轴，范围与纵横比只需设置一次)
+        fig, (ax1, ax2) = self._subplots(1, 2, figsize=figsize, dpi=dpi, sharex=True, sharey=True,
+                                       constrained_layout=True)
         
-        if len(all_points) > 0:
-            all_points = np.array(all_points)
-            x_min, y_min = all_points.min(axis=0)
-            x_max, y_max = all_points.max(axis=0)
+        # 计算边界 (所有层顶点拼接后一次求 min/max)
+        if polygons_by_layer:
+            points = np.concatenate([polygons.reshape(-1, 2) for polygons in polygons_by_layer.values()])
+            x_min, y_min = points.min(axis=0)
+            x_max, y_max = points.max(axis=0)
             
             # 添加边距
             margin = max(x_max - x_min, y_max - y_min) * 0.1
             
+            ax1.set_xlim(x_min - margin, x_max + margin)
+            ax1.set_ylim(y_min - margin, y_max + margin)
+            ax1.set_aspect('equal', share=True)
             for ax in [ax1, ax2]:
-                ax.set_xlim(x_min - margin, x_max + margin)
-                ax.set_ylim(y_min - margin, y_max + margin)
-                ax.set_aspect('equal')
                 ax.grid(True, alpha=0.3)
         
         # 左图：彩色版图
-        for layer, polygons in polygons_by_layer.items():
-            color = self.layer_colors.get(layer, '#CCCCCC')
-            layer_name = self.layer_names.get(layer, f"Layer {layer}")
-            
-            for polygon in polygons:
-                if len(polygon) > 2:
-                    poly_patch = patches.Polygon(polygon, 
-                                               facecolor=color, 
-                                               edgecolor='black',
-                                               linewidth=0.5,
-                                               alpha=0.7,
-                                               label=layer_name)
-                    ax1.add_patch(poly_patch)
+        collection, _ = self._layer_collection(polygons_by_layer, rasterize)
+        if collection is not None:
+            ax1.add_collection(collection)
         
         ax1.set_title("彩色版图", fontsize=14, fontweight='bold')
         ax1.set_xlabel('X (μm)', fontsize=12)
         ax1.set_ylabel('Y (μm)', fontsize=12)
         
-        # 右图：标注版图
-        for layer, polygons in polygons_by_layer.items():
-            layer_name = self.layer_names.get(layer, f"Layer {layer}")
+        # 右图：标注版图 (所有层合并为一个灰色 PolyCollection)
+        if polygons_by_layer:
+            ax2.add_collection(PolyCollection(np.concatenate(list(polygons_by_layer.values())),
+                                              facecolors='lightgray',
+                                              edgecolors='black',
+                                              linewidths=1,
+                                              alpha=0.5,
+                                              rasterized=rasterize))
+        
+        # 只标注主要结构层，多边形中心按层一次性计算
+        for layer in (2, 3, 4, 5):
+            polygons = polygons_by_layer.get(layer)
+            if polygons is None:
+                continue
             
-            for i, polygon in enumerate(polygons):
-                if len(polygon) > 2:
-                    # 计算多边形中心
-                    center = np.mean(polygon, axis=0)
-                    
-                    # 绘制多边形
-                    poly_patch = patches.Polygon(polygon, 
-                                               facecolor='lightgray', 
-                                               edgecolor='black',
-                                               linewidth=1,
-                                               alpha=0.5)
-                    ax2.add_patch(poly_patch)
-                    
-                    # 添加标注
-                    if layer in [2, 3, 4, 5]:  # 主要结构层
-                        ax2.annotate(layer_name, center, 
-                                   ha='center', va='center',
-                                   fontsize=8, fontweight='bold',
-                                   bbox=dict(boxstyle="round,pad=0.3", 
-                                           facecolor='white', 
-                                           alpha=0.8))
+            layer_name = self.LAYER_NAMES.get(layer, f"Layer {layer}")
+            for center in polygons.mean(axis=1):
+                ax2.annotate(layer_name, center, 
+                           ha='center', va='center',
+                           fontsize=8, fontweight='bold',
+                           bbox=dict(boxstyle="round,pad=0.3", 
+                                   facecolor='white', 
+                                   alpha=0.8))
         
         ax2.set_title("标注版图", fontsize=14, fontweight='bold')
         ax2.set_xlabel('X (μm)', fontsize=12)
@@ -357,5 +443,4 @@ class LayoutVisualizer:
         # 添加总标题
         fig.suptitle(title, fontsize=16, fontweight='bold')
         
-        plt.tight_layout()
         return fig 
\ No newline at end of file